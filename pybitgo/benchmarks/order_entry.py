@@ -0,0 +1,125 @@
+"""
+Order round-trip latency of place_limit_order on a client that opens a Session per
+request (how BitGoRESTClient used to work), on BitGoRESTClient with its shared
+Session and on OrderEntry, so the gain from connection reuse and the gain from
+templated bodies are measured separately. Runs against a local stand-in server
+over plain HTTP keep-alive, so TLS handshakes are not part of the numbers.
+
+    python benchmarks/order_entry.py [iterations]
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import sys
+from threading import Thread
+import time
+
+from pybitgo.rest.order import OrderEntry
+from pybitgo.rest.trade import BitGoRESTClient
+from pybitgo.util import Window
+from requests import Response, Session
+
+ORDER = json.dumps(
+    {
+        "id": "order",
+        "accountId": "account",
+        "product": "BTC-USD",
+        "type": "limit",
+        "side": "buy",
+        "status": "opened",
+    }
+).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def respond(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(ORDER)))
+        self.end_headers()
+        self.wfile.write(ORDER)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, *_):
+        pass
+
+
+class PerRequestClient(BitGoRESTClient):
+    def request(self, method: str, url: str, params: dict, json: dict) -> Response:
+
+        with Session() as session:
+            session.headers.update({"Authorization": "Bearer " + self.token})
+            res = session.request(method, self.base_url + url, params=params, json=json)
+
+            if res.status_code == 200:
+                return res
+
+        raise Exception(res.json())
+
+
+def measure(place, iterations: int, window: Window):
+    for i in range(iterations):
+        start = time.perf_counter()
+        place(str(i))
+        window.append(time.perf_counter() - start)
+
+
+def main(iterations: int = 2000):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    baseline = PerRequestClient("token", base_url)
+    client = BitGoRESTClient("token", base_url)
+    entry = OrderEntry("token", "account", base_url).warm()
+
+    paths = [
+        (
+            "per-request",
+            lambda i: baseline.place_limit_order(
+                "account", "BTC-USD", "buy", "1000", "USD", "20000", i
+            ),
+        ),
+        (
+            "BitGoRESTClient",
+            lambda i: client.place_limit_order(
+                "account", "BTC-USD", "buy", "1000", "USD", "20000", i
+            ),
+        ),
+        (
+            "OrderEntry",
+            lambda i: entry.place_limit_order(
+                "BTC-USD", "buy", "1000", "USD", "20000", i
+            ),
+        ),
+    ]
+    windows = [Window(iterations) for _ in paths]
+
+    for _, place in paths:
+        measure(place, iterations // 10, Window(iterations))
+
+    # interleave the paths so that drift on the machine affects them equally
+    for _ in range(10):
+        for (_, place), window in zip(paths, windows):
+            measure(place, iterations // 10, window)
+
+    for (name, _), window in zip(paths, windows):
+        percentiles = window.percentiles((50, 99))
+        print(
+            f"{name:>16}: p50 {percentiles[50] * 1e6:8.1f}us "
+            f"p99 {percentiles[99] * 1e6:8.1f}us"
+        )
+
+    client.close()
+    entry.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,3 @@
+from pybitgo.cli import main
+
+main()
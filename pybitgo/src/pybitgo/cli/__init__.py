@@ -0,0 +1,144 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+from typing import Any, List, Optional
+
+# Only the standard library is imported here so that queries start quickly. The
+# gateway, and with it requests and websocket-client, is imported by serve alone.
+
+
+def default_socket_path() -> str:
+    """
+    Get the gateway's Unix socket path: $PYBITGO_SOCKET, or pybitgo-<uid>.sock in
+    the temporary directory.
+    """
+
+    return os.environ.get(
+        "PYBITGO_SOCKET",
+        os.path.join(tempfile.gettempdir(), f"pybitgo-{os.getuid()}.sock"),
+    )
+
+
+def query(method: str, params: dict, path: Optional[str] = None) -> Any:
+    """
+    Send one request to a running gateway.
+
+    Args:
+        method (str): The gateway method e.g. balances.
+        params (dict): The method's keyword arguments.
+        path (str): The gateway's socket path.
+
+    Returns: Any
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path or default_socket_path())
+
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps({"method": method, "params": params}).encode())
+            stream.write(b"\n")
+            stream.flush()
+            res = json.loads(stream.readline())
+
+    if "error" in res:
+        raise Exception(res["error"])
+
+    return res["result"]
+
+
+def serve(args):
+    from pybitgo.gateway import Gateway
+
+    gateway = Gateway(
+        args.token,
+        args.base_url,
+        args.ws_url,
+        args.ttl,
+        args.max_book_age,
+    )
+
+    for product in args.product:
+        gateway.subscribe_level2(args.account, product)
+
+    if args.orders:
+        gateway.subscribe_orders(args.account)
+
+    gateway.serve_forever(args.socket)
+
+
+def main(argv: Optional[List[str]] = None):
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(prog="pybitgo")
+    parser.add_argument("--socket", default=None, help="gateway socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the gateway")
+    serve_parser.add_argument("--token", help="default: $BITGO_ACCESS_TOKEN")
+    serve_parser.add_argument(
+        "--base-url", default="https://app.bitgo.com/api/prime/trading/v1"
+    )
+    serve_parser.add_argument(
+        "--ws-url", default="wss://app.bitgo.com/api/prime/trading/v1/ws"
+    )
+    serve_parser.add_argument("--ttl", type=float, default=0.5, help="REST cache ttl")
+    serve_parser.add_argument(
+        "--max-book-age", type=float, default=5.0, help="fall back to REST after"
+    )
+    serve_parser.add_argument("--account", help="account for WS subscriptions")
+    serve_parser.add_argument(
+        "--product", action="append", default=[], help="cache level2 for product"
+    )
+    serve_parser.add_argument("--orders", action="store_true", help="cache orders")
+
+    commands.add_parser("ping")
+
+    balances_parser = commands.add_parser("balances")
+    balances_parser.add_argument("account_id")
+
+    orders_parser = commands.add_parser("orders")
+    orders_parser.add_argument("account_id")
+    orders_parser.add_argument("--open", action="store_true")
+    orders_parser.add_argument("--limit", type=int)
+
+    updates_parser = commands.add_parser("updates", help="cached WS order updates")
+    updates_parser.add_argument("account_id")
+
+    for name in ["book", "level1"]:
+        book_parser = commands.add_parser(name)
+        book_parser.add_argument("account_id")
+        book_parser.add_argument("product")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        if (args.orders or args.product) and not args.account:
+            serve_parser.error("--account is required for WS subscriptions")
+
+        args.token = args.token or os.environ.get("BITGO_ACCESS_TOKEN")
+
+        if not args.token:
+            serve_parser.error("--token or $BITGO_ACCESS_TOKEN is required")
+
+        try:
+            return serve(args)
+
+        except Exception as err:
+            sys.exit(f"pybitgo: {err}")
+
+    params = {
+        k: v for k, v in vars(args).items() if k not in ["socket", "command"] and v
+    }
+
+    try:
+        result = query(args.command, params, args.socket)
+
+    except OSError as err:
+        sys.exit(f"pybitgo: cannot reach the gateway ({err}), run `pybitgo serve`")
+
+    except Exception as err:
+        sys.exit(f"pybitgo: {err}")
+
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,229 @@
+from collections import OrderedDict
+from itertools import islice
+import json
+import os
+import socket
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from pybitgo.cli import default_socket_path
+from pybitgo.rest.schema import Balance, Level1, Level2, Order
+from pybitgo.rest.trade import BitGoRESTClient
+from pybitgo.ws import schema
+from pybitgo.ws.monitor import FeedMonitor
+from pybitgo.ws.redundant import RedundantBitGoWSClient
+
+_TERMINAL = ["completed", "canceled", "error"]
+
+
+class _GatewayWSClient(RedundantBitGoWSClient):
+    def __init__(self, gateway: "Gateway", token: str, url: str):
+
+        super().__init__(token, url, connections=1)
+        self.gateway = gateway
+
+    def on_level2_snapshot(self, msg: schema.Level2Snapshot):
+        self.gateway.books[msg["product"]] = msg
+
+    def on_level2_error(self, msg: schema.Level2Error):
+        print(msg)
+
+    def on_order(self, msg: schema.Order):
+        with self.gateway.lock:
+            updates = self.gateway.updates
+            updates[msg["orderId"]] = msg
+            updates.move_to_end(msg["orderId"])
+
+            if len(updates) > self.gateway.max_updates:
+                updates.popitem(last=False)
+
+
+class _Handler(StreamRequestHandler):
+    server: "_Server"
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                req = json.loads(line)
+                result = self.server.gateway.handle(req["method"], req["params"])
+                res = {"result": result}
+
+            except Exception as err:
+                res = {"error": str(err)}
+
+            self.wfile.write(json.dumps(res).encode() + b"\n")
+
+
+class _Server(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, gateway: "Gateway"):
+
+        self.gateway = gateway
+        super().__init__(path, _Handler)
+
+
+class Gateway:
+    def __init__(
+        self,
+        token: str,
+        base_url: str = "https://app.bitgo.com/api/prime/trading/v1",
+        ws_url: str = "wss://app.bitgo.com/api/prime/trading/v1/ws",
+        coalesce_ttl: float = 0.5,
+        max_book_age: float = 5.0,
+        max_updates: int = 4096,
+    ):
+        """
+        A long-running process that holds warm REST connections, WS subscriptions
+        and their caches, and answers requests from the pybitgo CLI over a Unix
+        socket. Requests and responses are single lines of JSON:
+        {"method": ..., "params": {...}} and {"result": ...} or {"error": ...}.
+
+        Args:
+            token (str): The access token.
+            base_url (str): The REST url.
+            ws_url (str): The WebSocket url.
+            coalesce_ttl (float): Seconds a REST read is reused for.
+            max_book_age (float): Seconds without a level2 snapshot after which the
+                cached book is stale and book() falls back to REST.
+            max_updates (int): The number of orders whose latest update is kept.
+        """
+
+        self.client = BitGoRESTClient(
+            token, base_url, coalesce=True, coalesce_ttl=coalesce_ttl
+        )
+        self.monitor = FeedMonitor(max_interval=max_book_age)
+        self.ws = _GatewayWSClient(self, token, ws_url)
+        self.ws.observe_level2(self.monitor.record)
+        self.max_updates = max_updates
+        self.books: Dict[str, schema.Level2Snapshot] = {}
+        self.updates: "OrderedDict[str, schema.Order]" = OrderedDict()
+        self.lock = Lock()
+        self.server: Optional[_Server] = None
+        self.methods: Dict[str, Callable[..., Any]] = {
+            "ping": self.ping,
+            "balances": self.balances,
+            "orders": self.orders,
+            "updates": self.order_updates,
+            "book": self.book,
+            "level1": self.level1,
+        }
+
+    def subscribe_level2(self, account_id: str, product_id: str) -> "Gateway":
+        """
+        Keep the latest level2 snapshot of a product in memory.
+        """
+
+        self.ws.subscribe_level2(account_id, product_id)
+
+        return self
+
+    def subscribe_orders(self, account_id: str) -> "Gateway":
+        """
+        Keep the latest update of the max_updates most recently updated orders in
+        memory.
+        """
+
+        self.ws.subscribe_orders(account_id)
+
+        return self
+
+    def handle(self, method: str, params: dict) -> Any:
+        if method not in self.methods:
+            raise Exception(f"unknown method: {method}")
+
+        return self.methods[method](**params)
+
+    def serve_forever(self, path: Optional[str] = None):
+        """
+        Start the WS subscriptions, if any, and serve requests until interrupted.
+        Refuses to start if another gateway is already serving path.
+
+        Args:
+            path (str): The socket path, by default default_socket_path().
+        """
+
+        path = path or default_socket_path()
+
+        if os.path.exists(path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(path)
+                    running = True
+
+                except OSError:
+                    running = False
+
+            if running:
+                raise Exception(f"a gateway is already serving {path}")
+
+            os.unlink(path)
+
+        if self.ws.legs[0].subscriptions:
+            self.ws.start()
+
+        umask = os.umask(0o177)
+        try:
+            self.server = _Server(path, self)
+        finally:
+            os.umask(umask)
+
+        try:
+            self.server.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            self.server.server_close()
+            self.ws.close()
+            self.client.close()
+            os.unlink(path)
+
+    def shutdown(self):
+        """
+        Stop serve_forever from another thread.
+        """
+
+        if self.server is not None:
+            self.server.shutdown()
+
+    def ping(self) -> str:
+        return "pong"
+
+    def balances(self, account_id: str) -> List[Balance]:
+        return list(self.client.get_account_balance(account_id))
+
+    def orders(
+        self, account_id: str, open: bool = False, limit: Optional[int] = None
+    ) -> List[Order]:
+        orders = self.client.list_orders(account_id, limit=limit)
+        orders = (o for o in orders if not open or o["status"] not in _TERMINAL)
+
+        return list(islice(orders, limit))
+
+    def order_updates(self, account_id: str) -> List[schema.Order]:
+        with self.lock:
+            return [u for u in self.updates.values() if u["accountId"] == account_id]
+
+    def book(self, account_id: str, product: str) -> Level2:
+        """
+        Get the cached level2 snapshot of a product, or fetch it over REST if the
+        product is not subscribed or its feed is stale.
+        """
+
+        snapshot = self.books.get(product)
+
+        if snapshot is not None and not self.monitor.is_stale(product):
+            return {
+                "time": snapshot["time"],
+                "product": snapshot["product"],
+                "bids": snapshot["bids"],
+                "asks": snapshot["asks"],
+            }
+
+        return self.client.get_level2(account_id, product)
+
+    def level1(self, account_id: str, product: str) -> Level1:
+        return self.client.get_level1(account_id, product)
@@ -0,0 +1,245 @@
+import json
+from json.encoder import encode_basestring
+from threading import Event, Lock, Thread
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+from pybitgo.rest.schema import Order
+from pybitgo.util import Window
+from requests import Session
+
+if TYPE_CHECKING:
+    from pybitgo.ws.monitor import FeedMonitor
+
+
+class OrderEntry:
+    def __init__(
+        self,
+        token: str,
+        account_id: str,
+        base_url: str = "https://app.bitgo.com/api/prime/trading/v1",
+        keepalive_interval: float = 15.0,
+        window: int = 1024,
+        feed_monitor: Optional["FeedMonitor"] = None,
+    ):
+        """
+        A low-latency path for placing orders on one trading account. It keeps a
+        warm connection, prebuilds the constant part of each order body per product,
+        type and side, serializes only the fields that change and records the
+        round-trip time of every order.
+
+        Args:
+            token (str): The access token.
+            account_id (str): The id of the trading account.
+            base_url (str): The REST url.
+            keepalive_interval (float): Seconds between background keep-alive pings.
+            window (int): The number of round-trip times kept for percentiles.
+            feed_monitor (FeedMonitor): Refuse orders for stale products.
+        """
+
+        self.base_url = base_url
+        self.orders_url = f"{base_url}/accounts/{account_id}/orders"
+        self.keepalive_interval = keepalive_interval
+        self.feed_monitor = feed_monitor
+        self.templates: Dict[Tuple[str, str, str], str] = {}
+        self.latencies = Window(window)
+        self.lock = Lock()
+        self.stopped = Event()
+        self.session = Session()
+        self.session.headers.update(
+            {
+                "Authorization": "Bearer " + token,
+                "Content-Type": "application/json",
+            }
+        )
+
+    def warm(self) -> "OrderEntry":
+        """
+        Open the connection (or keep it open) with a cheap authenticated request.
+        """
+
+        self.session.get(self.base_url + "/user/current").close()
+
+        return self
+
+    def start(self) -> Thread:
+        """
+        Warm the connection every keepalive_interval seconds on a daemon thread
+        until stop(), so that orders never pay for a new TLS handshake.
+
+        Returns: Thread
+        """
+
+        self.stopped.clear()
+
+        def run():
+            while True:
+                try:
+                    self.warm()
+
+                except Exception as err:
+                    print(err)
+
+                if self.stopped.wait(self.keepalive_interval):
+                    return
+
+        thread = Thread(target=run, name="OrderEntry", daemon=True)
+        thread.start()
+
+        return thread
+
+    def stop(self):
+        self.stopped.set()
+
+    def close(self):
+        """
+        Stop the keep-alive thread and close the connection.
+        """
+
+        self.stop()
+        self.session.close()
+
+    def template(self, product: str, type: str, side: str) -> str:
+        """
+        Get the serialized constant fields of an order body, without the closing
+        brace.
+        """
+
+        key = (product, type, side)
+
+        if (template := self.templates.get(key)) is None:
+            template = self.templates[key] = json.dumps(
+                {"product": product, "type": type, "side": side},
+                separators=(",", ":"),
+            )[:-1]
+
+        return template
+
+    def send(self, body: str, start: Optional[float] = None) -> Order:
+        """
+        Post a serialized order body and record the round-trip time of accepted
+        orders. Rejected orders are not recorded so they do not skew percentiles.
+
+        Args:
+            body (str): The JSON body.
+            start (float): The perf_counter() value the round trip is measured from,
+                by default now.
+
+        Returns: Order
+        """
+
+        if start is None:
+            start = time.perf_counter()
+
+        res = self.session.post(self.orders_url, data=body.encode())
+        elapsed = time.perf_counter() - start
+
+        if res.status_code == 200:
+            with self.lock:
+                self.latencies.append(elapsed)
+
+            return res.json()
+
+        raise Exception(res.json())
+
+    def place_market_order(
+        self,
+        product: str,
+        side: str,
+        quantity: str,
+        quantity_currency: str,
+        client_order_id: Optional[str] = None,
+    ) -> Order:
+        """
+        Places a new Market order. Same as BitGoRESTClient.place_market_order.
+
+        Args:
+            product (str): Product name e.g. BTC-USD.
+            side (str): The side of the order. Either "buy" or "sell".
+            quantity (str): The quantity of the order.
+            quantity_currency (str): The quantity currency must be in quote currency for
+                buy and base currency for sell.
+            client_order_id (str): The client order id of the order.
+
+        Returns: Order
+        """
+
+        start = time.perf_counter()
+
+        assert side in ["buy", "sell"], "side must be either 'buy' or 'sell'"
+
+        if self.feed_monitor is not None:
+            self.feed_monitor.guard(product)
+
+        body = (
+            self.template(product, "market", side)
+            + ',"quantity":'
+            + encode_basestring(quantity)
+            + ',"quantityCurrency":'
+            + encode_basestring(quantity_currency)
+        )
+
+        if client_order_id is not None:
+            body += ',"clientOrderId":' + encode_basestring(client_order_id)
+
+        return self.send(body + "}", start)
+
+    def place_limit_order(
+        self,
+        product: str,
+        side: str,
+        quantity: str,
+        quantity_currency: str,
+        limit_price: str,
+        client_order_id: Optional[str] = None,
+        duration: Optional[int] = None,
+    ) -> Order:
+        """
+        Places a new Limit order. Same as BitGoRESTClient.place_limit_order.
+
+        Args:
+            product (str): Product name e.g. BTC-USD.
+            side (str): The side of the order. Either "buy" or "sell".
+            quantity (str): The quantity of the order.
+            quantity_currency (str): The quantity currency must be in quote currency for
+                buy and base currency for sell.
+            limit_price (str): The limit price of the order.
+            client_order_id (str): The client order id of the order.
+            duration (int): Duration of the limit order in minutes.
+
+        Returns: Order
+        """
+
+        start = time.perf_counter()
+
+        assert side in ["buy", "sell"], "side must be either 'buy' or 'sell'"
+
+        if self.feed_monitor is not None:
+            self.feed_monitor.guard(product)
+
+        body = (
+            self.template(product, "limit", side)
+            + ',"quantity":'
+            + encode_basestring(quantity)
+            + ',"quantityCurrency":'
+            + encode_basestring(quantity_currency)
+            + ',"limitPrice":'
+            + encode_basestring(limit_price)
+        )
+
+        if client_order_id is not None:
+            body += ',"clientOrderId":' + encode_basestring(client_order_id)
+
+        if duration is not None:
+            body += ',"duration":' + str(int(duration))
+
+        return self.send(body + "}", start)
+
+    def latency_percentiles(self, qs: Iterable[float] = (50, 99)) -> Dict[float, float]:
+        """
+        Get percentiles of the round-trip time of accepted orders in seconds,
+        measured from the call to the response.
+        """
+
+        with self.lock:
+            return self.latencies.percentiles(qs)
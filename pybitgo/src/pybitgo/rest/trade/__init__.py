@@ -1,4 +1,6 @@
-from typing import Iterator, Optional
+from threading import Event, Lock
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
 from pybitgo.rest.schema import (
     Account,
@@ -13,26 +15,147 @@ from pybitgo.rest.schema import (
 )
 from requests import Response, Session
 
+if TYPE_CHECKING:
+    from pybitgo.ws.monitor import FeedMonitor
+
+
+class _Flight:
+    def __init__(self):
+
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[Exception] = None
+        self.time = 0.0
+
 
 class BitGoRESTClient:
     def __init__(
-        self, token: str, base_url: str = "https://app.bitgo.com/api/prime/trading/v1"
+        self,
+        token: str,
+        base_url: str = "https://app.bitgo.com/api/prime/trading/v1",
+        feed_monitor: Optional["FeedMonitor"] = None,
+        coalesce: bool = False,
+        coalesce_ttl: float = 0.0,
     ):
 
         self.token = token
         self.base_url = base_url
+        self.feed_monitor = feed_monitor
+        self.coalesce = coalesce
+        self.coalesce_ttl = coalesce_ttl
+        self.flights: Dict[Tuple[str, tuple], _Flight] = {}
+        self.flights_lock = Lock()
+        self.session = Session()
+        self.session.headers.update({"Authorization": "Bearer " + self.token})
 
     def request(self, method: str, url: str, params: dict, json: dict) -> Response:
 
-        with Session() as session:
-            session.headers.update({"Authorization": "Bearer " + self.token})
-            res = session.request(method, self.base_url + url, params=params, json=json)
+        try:
+            res = self.session.request(
+                method, self.base_url + url, params=params, json=json
+            )
 
-            if res.status_code == 200:
-                return res
+        finally:
+            if method != "GET" and url.startswith("/accounts/"):
+                self.invalidate(url.split("/")[2])
+
+        if res.status_code == 200:
+            return res
 
         raise Exception(res.json())
 
+    def close(self):
+        """
+        Close the pooled connections.
+        """
+
+        self.session.close()
+
+    def get(self, url: str, params: dict, cache: bool = True) -> Any:
+        """
+        Send a GET request and parse its JSON body. With coalesce, concurrent
+        identical GETs share one request and the same parsed result, and, with
+        cache, a result at most coalesce_ttl seconds old is reused until a write to
+        the same account invalidates it. Shared results must not be mutated. Failed
+        requests are never shared with later callers.
+
+        Args:
+            url (str): The url relative to base_url.
+            params (dict): The query parameters.
+            cache (bool): Whether the result may be reused once the request is done.
+
+        Returns: Any
+        """
+
+        if not self.coalesce:
+            return self.request("GET", url, params, {}).json()
+
+        key = (url, tuple(sorted(params.items())))
+
+        with self.flights_lock:
+            now = time.monotonic()
+            flight = self.flights.get(key)
+
+            if flight is None or (
+                flight.done.is_set() and now - flight.time > self.coalesce_ttl
+            ):
+                # drop every expired result so the table only holds recent keys
+                for expired in [
+                    k
+                    for k, f in self.flights.items()
+                    if f.done.is_set() and now - f.time > self.coalesce_ttl
+                ]:
+                    del self.flights[expired]
+
+                flight = self.flights[key] = _Flight()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+
+            if flight.error is not None:
+                raise flight.error
+
+            return flight.result
+
+        try:
+            flight.result = self.request("GET", url, params, {}).json()
+
+        except Exception as err:
+            flight.error = err
+            raise
+
+        finally:
+            flight.time = time.monotonic()
+
+            with self.flights_lock:
+                if (
+                    flight.error is not None or not cache or self.coalesce_ttl <= 0
+                ) and self.flights.get(key) is flight:
+                    del self.flights[key]
+
+            flight.done.set()
+
+        return flight.result
+
+    def invalidate(self, account_id: str):
+        """
+        Stop reusing coalesced reads of an account, e.g. after placing an order on
+        it through another client. Requests already in flight are still shared with
+        their waiters but not reused afterwards.
+
+        Args:
+            account_id (str): The id of the trading account.
+        """
+
+        prefix = f"/accounts/{account_id}/"
+
+        with self.flights_lock:
+            for key in [k for k in self.flights if k[0].startswith(prefix)]:
+                del self.flights[key]
+
     def paginated_request(
         self, method: str, url: str, params: dict, json: dict
     ) -> Iterator[Response]:
@@ -50,7 +173,7 @@ class BitGoRESTClient:
         Returns: User
         """
 
-        return self.request("GET", "/user/current", {}, {}).json()
+        return self.get("/user/current", {})
 
     def list_accounts(self) -> Iterator[Account]:
         """
@@ -59,7 +182,7 @@ class BitGoRESTClient:
         Yields: Account
         """
 
-        for account in self.request("GET", "/accounts", {}, {}).json()["data"]:
+        for account in self.get("/accounts", {})["data"]:
             yield account
 
     def get_account_balance(self, account_id: str) -> Iterator[Balance]:
@@ -72,9 +195,7 @@ class BitGoRESTClient:
         Yields: Balance
         """
 
-        for balance in self.request(
-            "GET", f"/accounts/{account_id}/balances", {}, {}
-        ).json()["data"]:
+        for balance in self.get(f"/accounts/{account_id}/balances", {})["data"]:
             yield balance
 
     def list_orders(
@@ -142,10 +263,16 @@ class BitGoRESTClient:
 
 
         Returns: Order
+
+        Raises:
+            StaleFeedError: If feed_monitor halts orders for a stale product.
         """
 
         assert side in ["buy", "sell"], "side must be either 'buy' or 'sell'"
 
+        if self.feed_monitor is not None:
+            self.feed_monitor.guard(product)
+
         return self.request(
             "POST",
             f"/accounts/{account_id}/orders",
@@ -189,10 +316,16 @@ class BitGoRESTClient:
             duration (int): Duration of the limit order in minutes.
 
         Returns: Order
+
+        Raises:
+            StaleFeedError: If feed_monitor halts orders for a stale product.
         """
 
         assert side in ["buy", "sell"], "side must be either 'buy' or 'sell'"
 
+        if self.feed_monitor is not None:
+            self.feed_monitor.guard(product)
+
         return self.request(
             "POST",
             f"/accounts/{account_id}/orders",
@@ -242,10 +375,16 @@ class BitGoRESTClient:
             schedule_date (str): The schedule date of the order.
 
         Returns: Order
+
+        Raises:
+            StaleFeedError: If feed_monitor halts orders for a stale product.
         """
 
         assert side in ["buy", "sell"], "side must be either 'buy' or 'sell'"
 
+        if self.feed_monitor is not None:
+            self.feed_monitor.guard(product)
+
         return self.request(
             "POST",
             f"/accounts/{account_id}/orders",
@@ -275,12 +414,11 @@ class BitGoRESTClient:
         Returns: Order
         """
 
-        return self.request(
-            "GET",
+        return self.get(
             f"/accounts/{account_id}/orders/{order_id}",
             {},
-            {},
-        ).json()
+            cache=False,
+        )
 
     def cancel_order(self, account_id: str, order_id: str):
         """
@@ -351,12 +489,11 @@ class BitGoRESTClient:
         Returns: Trade
         """
 
-        return self.request(
-            "GET",
+        return self.get(
             f"/accounts/{account_id}/trades/{trade_id}",
             {},
-            {},
-        ).json()
+            cache=False,
+        )
 
     def list_currencies(self, account_id: str) -> Iterator[Currency]:
         """
@@ -368,12 +505,10 @@ class BitGoRESTClient:
         Yields: Currency
         """
 
-        for currency in self.request(
-            "GET",
+        for currency in self.get(
             f"/accounts/{account_id}/currencies",
             {},
-            {},
-        ).json()["data"]:
+        )["data"]:
             yield currency
 
     def list_products(self, account_id: str) -> Iterator[Product]:
@@ -386,12 +521,10 @@ class BitGoRESTClient:
         Yields: Product
         """
 
-        for product in self.request(
-            "GET",
+        for product in self.get(
             f"/accounts/{account_id}/products",
             {},
-            {},
-        ).json()["data"]:
+        )["data"]:
             yield product
 
     def get_level1(self, account_id: str, product: str) -> Level1:
@@ -405,12 +538,10 @@ class BitGoRESTClient:
         Returns: Level1
         """
 
-        return self.request(
-            "GET",
+        return self.get(
             f"/accounts/{account_id}/products/{product}/level1",
             {},
-            {},
-        ).json()
+        )
 
     def get_level2(self, account_id: str, product: str) -> Level2:
         """
@@ -423,9 +554,7 @@ class BitGoRESTClient:
         Returns: Level2
         """
 
-        return self.request(
-            "GET",
+        return self.get(
             f"/accounts/{account_id}/products/{product}/level2",
             {},
-            {},
-        ).json()
+        )
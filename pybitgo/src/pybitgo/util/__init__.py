@@ -0,0 +1,70 @@
+from array import array
+from calendar import timegm
+import re
+from time import strptime
+from typing import Dict, Iterable
+
+_TIME = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|([+-])(\d{2}):?(\d{2}))?$"
+)
+
+
+def parse_time(value: str) -> float:
+    """
+    Parse an ISO 8601 timestamp as sent by BitGo (e.g. 2022-07-14T18:35:41.123Z).
+
+    Args:
+        value (str): The timestamp. Timestamps without an offset are read as UTC.
+
+    Returns: float, seconds since the epoch
+    """
+
+    match = _TIME.match(value)
+
+    if match is None:
+        raise ValueError(f"invalid timestamp: {value}")
+
+    seconds = timegm(strptime(match[1], "%Y-%m-%dT%H:%M:%S"))
+
+    if match[2]:
+        seconds += float("0." + match[2])
+
+    if match[4]:
+        offset = int(match[5]) * 3600 + int(match[6]) * 60
+        seconds -= offset if match[4] == "+" else -offset
+
+    return seconds
+
+
+class Window:
+    def __init__(self, size: int):
+        """
+        A fixed-size window of the most recent float samples.
+
+        Args:
+            size (int): The number of samples kept.
+        """
+
+        self.values = array("d", bytes(8 * size))
+        self.count = 0
+
+    def append(self, value: float):
+        self.values[self.count % len(self.values)] = value
+        self.count += 1
+
+    def percentiles(self, qs: Iterable[float]) -> Dict[float, float]:
+        """
+        Get nearest-rank percentiles of the samples, NaN while empty.
+
+        Args:
+            qs (Iterable[float]): The percentiles, between 0 and 100.
+
+        Returns: Dict[float, float]
+        """
+
+        values = sorted(self.values[: min(self.count, len(self.values))])
+
+        if not values:
+            return {q: float("nan") for q in qs}
+
+        return {q: values[round(q / 100 * (len(values) - 1))] for q in qs}
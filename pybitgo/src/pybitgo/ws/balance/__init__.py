@@ -0,0 +1,259 @@
+from decimal import Decimal
+from threading import Event, Lock, Thread
+from typing import Dict, List, Set, Tuple, TypedDict, Union
+
+from pybitgo.rest.schema import Balance
+from pybitgo.rest.trade import BitGoRESTClient
+from pybitgo.ws.schema import Order
+
+_TERMINAL = ["completed", "canceled", "error"]
+
+
+class BalanceDrift(TypedDict):
+    currency: str
+    field: str
+    local: str
+    remote: str
+
+
+class _Hold:
+    def __init__(self, currency: str, remaining: Decimal):
+
+        self.currency = currency
+        self.remaining = remaining
+        self.fills: Set[str] = set()
+
+
+class BalanceEngine:
+    def __init__(
+        self,
+        client: BitGoRESTClient,
+        account_id: str,
+        reconcile_interval: float = 60.0,
+        tolerance: Union[str, Decimal] = "0",
+        adopt: bool = True,
+    ):
+        """
+        Keeps a local copy of a trading account's balances, seeded from REST and
+        updated from the orders channel, so that balance checks on the order path
+        are memory reads. Feed it every order update with
+        engine.on_order(msg) from BitGoWSClient.on_order.
+
+        Buys hold their quantity in the quote currency and sells hold theirs in the
+        base currency, matching how orders must be placed. Fees and orders opened
+        before seeding are not modelled and show up as drift on reconcile.
+
+        Args:
+            client (BitGoRESTClient): The client used to seed and reconcile.
+            account_id (str): The id of the trading account.
+            reconcile_interval (float): Seconds between background reconciles.
+            tolerance (str): Differences up to this amount are not reported as drift.
+            adopt (bool): Whether reconcile replaces the local balances with REST.
+                Turn it off to only report drift, e.g. if REST lags the orders
+                channel.
+        """
+
+        self.client = client
+        self.account_id = account_id
+        self.reconcile_interval = reconcile_interval
+        self.tolerance = Decimal(tolerance)
+        self.adopt = adopt
+        self.balances: Dict[str, Dict[str, Decimal]] = {}
+        self.products: Dict[str, Tuple[str, str]] = {}
+        self.holds: Dict[str, _Hold] = {}
+        self.dirty = False
+        self.lock = Lock()
+        self.stopped = Event()
+
+    def seed(self) -> "BalanceEngine":
+        """
+        Load the products and replace the local balances with the REST balances.
+        """
+
+        products = {
+            product["name"]: (product["baseCurrency"], product["quoteCurrency"])
+            for product in self.client.list_products(self.account_id)
+        }
+        balances = self.fetch()
+
+        with self.lock:
+            self.products = products
+            self.balances = balances
+            self.holds.clear()
+
+        return self
+
+    def fetch(self) -> Dict[str, Dict[str, Decimal]]:
+        return {
+            balance["currency"]: {
+                "balance": Decimal(balance["balance"]),
+                "heldBalance": Decimal(balance["heldBalance"]),
+            }
+            for balance in self.client.get_account_balance(self.account_id)
+        }
+
+    def on_order(self, msg: Order):
+        """
+        Apply an update from the orders channel: hold funds when an order is first
+        seen, move funds on every new fill and release what is left of the hold
+        once the order is completed, canceled or rejected.
+
+        Args:
+            msg (Order): The order update.
+        """
+
+        if msg["product"] not in self.products:
+            return
+
+        base, quote = self.products[msg["product"]]
+
+        with self.lock:
+            if (hold := self.holds.get(msg["orderId"])) is None:
+                if msg["status"] in _TERMINAL and not msg.get("fillQuantity"):
+                    return
+
+                currency = quote if msg["side"] == "buy" else base
+                hold = self.holds[msg["orderId"]] = _Hold(
+                    currency, Decimal(msg["quantity"])
+                )
+                self.adjust(currency, "heldBalance", hold.remaining)
+
+            if msg.get("fillQuantity") and msg.get("fillPrice"):
+                fill_id = msg.get("traddeId") or msg["time"]
+
+                if fill_id not in hold.fills:
+                    hold.fills.add(fill_id)
+                    self.fill(msg, hold, base, quote)
+
+            if msg["status"] in _TERMINAL:
+                self.adjust(hold.currency, "heldBalance", -hold.remaining)
+                del self.holds[msg["orderId"]]
+
+    def fill(self, msg: Order, hold: _Hold, base: str, quote: str):
+        quantity = Decimal(msg["fillQuantity"])
+        notional = quantity * Decimal(msg["fillPrice"])
+        sign = 1 if msg["side"] == "buy" else -1
+        released = min(notional if sign > 0 else quantity, hold.remaining)
+
+        hold.remaining -= released
+        self.adjust(hold.currency, "heldBalance", -released)
+        self.adjust(base, "balance", sign * quantity)
+        self.adjust(quote, "balance", -sign * notional)
+
+    def adjust(self, currency: str, field: str, amount: Decimal):
+        balance = self.balances.setdefault(
+            currency, {"balance": Decimal(0), "heldBalance": Decimal(0)}
+        )
+        balance[field] += amount
+        self.dirty = True
+
+    def get_balance(self, currency: str) -> Balance:
+        """
+        Get the local balance of a currency in the same shape as the REST API.
+
+        Args:
+            currency (str): The currency e.g. BTC.
+
+        Returns: Balance
+        """
+
+        with self.lock:
+            balance = self.balances[currency]
+
+            return {
+                "currencyId": currency,
+                "currency": currency,
+                "balance": str(balance["balance"]),
+                "heldBalance": str(balance["heldBalance"]),
+                "tradableBalance": str(balance["balance"] - balance["heldBalance"]),
+            }
+
+    def tradable(self, currency: str) -> Decimal:
+        """
+        Get the local tradable balance of a currency.
+        """
+
+        balance = self.balances.get(currency)
+
+        if balance is None:
+            return Decimal(0)
+
+        return balance["balance"] - balance["heldBalance"]
+
+    def has_tradable(self, currency: str, amount: Union[str, Decimal]) -> bool:
+        """
+        Whether the local tradable balance of a currency covers amount.
+        """
+
+        return self.tradable(currency) >= Decimal(amount)
+
+    def reconcile(self) -> List[BalanceDrift]:
+        """
+        Compare the local balances with REST, report every difference to on_drift
+        and, if adopt is set, adopt the REST balances. If an update was applied
+        while the REST request was in flight there is no telling whether REST
+        already includes it, so the local balances are kept and the drift, which
+        may then be spurious, is only reported; the next reconcile adopts.
+
+        Returns: List[BalanceDrift]
+        """
+
+        with self.lock:
+            self.dirty = False
+
+        remote = self.fetch()
+        drifts: List[BalanceDrift] = []
+
+        with self.lock:
+            for currency in sorted(set(remote) | set(self.balances)):
+                zero = {"balance": Decimal(0), "heldBalance": Decimal(0)}
+                local_balance = self.balances.get(currency, zero)
+                remote_balance = remote.get(currency, zero)
+
+                for field in ["balance", "heldBalance"]:
+                    local = local_balance[field]
+                    if abs(local - remote_balance[field]) > self.tolerance:
+                        drifts.append(
+                            {
+                                "currency": currency,
+                                "field": field,
+                                "local": str(local),
+                                "remote": str(remote_balance[field]),
+                            }
+                        )
+
+            if self.adopt and not self.dirty:
+                self.balances = remote
+
+        for drift in drifts:
+            self.on_drift(drift)
+
+        return drifts
+
+    def start(self) -> Thread:
+        """
+        Reconcile every reconcile_interval seconds on a daemon thread until stop().
+
+        Returns: Thread
+        """
+
+        self.stopped.clear()
+
+        def run():
+            while not self.stopped.wait(self.reconcile_interval):
+                try:
+                    self.reconcile()
+
+                except Exception as err:
+                    print(err)
+
+        thread = Thread(target=run, name="BalanceEngine", daemon=True)
+        thread.start()
+
+        return thread
+
+    def stop(self):
+        self.stopped.set()
+
+    def on_drift(self, drift: BalanceDrift):
+        print(drift)
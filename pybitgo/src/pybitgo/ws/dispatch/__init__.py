@@ -0,0 +1,265 @@
+from concurrent.futures import Executor
+from queue import Full, Queue
+from threading import Lock, Thread
+import time
+from typing import Any, Callable, Hashable, List, Optional, TypedDict
+
+
+class DispatcherStats(TypedDict):
+    submitted: int
+    completed: int
+    dropped: int
+    errors: int
+    depth: int
+    max_depth: int
+    blocked_seconds: float
+    lane_depths: List[int]
+
+
+_STOP = object()
+
+
+class _Lane:
+    def __init__(self, dispatcher: "CallbackDispatcher", index: int, queue_size: int):
+
+        self.dispatcher = dispatcher
+        self.queue: Queue = Queue(queue_size)
+        self.lock = Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.blocked_seconds = 0.0
+        self.thread = Thread(
+            target=self.run, name=f"CallbackDispatcher-{index}", daemon=True
+        )
+
+    def put(self, item: tuple):
+        try:
+            self.queue.put_nowait(item)
+
+        except Full:
+            if self.dispatcher.overflow == "block":
+                start = time.perf_counter()
+                self.queue.put(item)
+
+                with self.lock:
+                    self.blocked_seconds += time.perf_counter() - start
+
+            elif not item[3]:
+                self.force(item)
+
+            elif self.dispatcher.overflow == "drop_newest" or (
+                not self.put_dropping_oldest(item)
+            ):
+                with self.lock:
+                    self.dropped += 1
+                return
+
+        with self.lock:
+            self.submitted += 1
+            self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def force(self, item: tuple):
+        """
+        Queue item past queue_size instead of blocking the caller.
+        """
+
+        queue = self.queue
+
+        with queue.mutex:
+            queue.queue.append(item)
+            queue.unfinished_tasks += 1
+            queue.not_empty.notify()
+
+    def put_dropping_oldest(self, item: tuple) -> bool:
+        """
+        Make room by evicting the oldest droppable item with the same key, or
+        failing that the oldest droppable item of any key. Returns False, without
+        queueing item, if every queued item is undroppable.
+        """
+
+        while True:
+            try:
+                self.queue.put_nowait(item)
+                return True
+
+            except Full:
+                if not self.evict(item[0]):
+                    return False
+
+    def evict(self, key: Hashable) -> bool:
+        queue = self.queue
+
+        with queue.mutex:
+            droppable = [
+                i
+                for i, queued in enumerate(queue.queue)
+                if queued is not _STOP and queued[3]
+            ]
+            same_key = [i for i in droppable if queue.queue[i][0] == key]
+
+            if droppable:
+                del queue.queue[(same_key or droppable)[0]]
+                queue.unfinished_tasks -= 1
+
+                if not queue.unfinished_tasks:
+                    queue.all_tasks_done.notify_all()
+
+                queue.not_full.notify()
+
+            else:
+                return False
+
+        with self.lock:
+            self.dropped += 1
+
+        return True
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+
+            try:
+                if item is _STOP:
+                    return
+
+                _, callback, msg, _ = item
+
+                try:
+                    if self.dispatcher.executor is None:
+                        callback(msg)
+                    else:
+                        self.dispatcher.executor.submit(callback, msg).result()
+
+                except Exception as err:
+                    with self.lock:
+                        self.errors += 1
+                    self.dispatcher.on_error(err)
+
+                with self.lock:
+                    self.completed += 1
+
+            finally:
+                self.queue.task_done()
+
+
+class CallbackDispatcher:
+    def __init__(
+        self,
+        workers: int = 4,
+        queue_size: int = 1024,
+        overflow: str = "drop_oldest",
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Hands callbacks off the WebSocket receive thread to a pool of worker lanes.
+        Every key (e.g. a product) is pinned to a single lane, so callbacks for the
+        same key run in the order they were submitted.
+
+        Args:
+            workers (int): The number of lanes.
+            queue_size (int): The maximum number of pending callbacks per lane.
+            overflow (str): What to do when a lane is full. Either "drop_oldest",
+                "drop_newest" or "block". "drop_oldest" evicts the oldest droppable
+                callback with the same key, else the oldest droppable callback of
+                any key, and drops the new one if there are none. Except under
+                "block", undroppable callbacks are queued past queue_size.
+            executor (Executor): Run callbacks in this executor instead of on the
+                lane thread, e.g. a ProcessPoolExecutor. The lane waits for each
+                result, so per-key ordering still holds. Callbacks and messages must
+                be picklable for process pools, so declare overridden client
+                callbacks as staticmethods.
+        """
+
+        assert workers > 0, "workers must be positive"
+        assert queue_size > 0, "queue_size must be positive"
+        assert overflow in [
+            "drop_oldest",
+            "drop_newest",
+            "block",
+        ], "overflow must be either 'drop_oldest', 'drop_newest' or 'block'"
+
+        self.overflow = overflow
+        self.executor = executor
+        self.lanes = [_Lane(self, i, queue_size) for i in range(workers)]
+
+        for lane in self.lanes:
+            lane.thread.start()
+
+    def submit(
+        self,
+        key: Hashable,
+        callback: Callable[[Any], None],
+        msg: Any,
+        droppable: bool = True,
+    ):
+        """
+        Queue a callback on the lane that owns key. Only blocks the caller if the
+        lane is full and overflow is "block".
+
+        Args:
+            key (Hashable): The ordering key, e.g. a product name.
+            callback (Callable): The callback to run.
+            msg (Any): The message passed to the callback.
+            droppable (bool): Whether the callback may be dropped under backpressure.
+                Level2 snapshots supersede earlier snapshots of the same product and
+                are droppable, order updates are not.
+        """
+
+        self.lanes[hash(key) % len(self.lanes)].put((key, callback, msg, droppable))
+
+    def stats(self) -> DispatcherStats:
+        """
+        Get backpressure metrics aggregated across all lanes.
+
+        Returns: DispatcherStats
+        """
+
+        stats: DispatcherStats = {
+            "submitted": 0,
+            "completed": 0,
+            "dropped": 0,
+            "errors": 0,
+            "depth": 0,
+            "max_depth": 0,
+            "blocked_seconds": 0.0,
+            "lane_depths": [],
+        }
+
+        for lane in self.lanes:
+            with lane.lock:
+                depth = lane.queue.qsize()
+                stats["submitted"] += lane.submitted
+                stats["completed"] += lane.completed
+                stats["dropped"] += lane.dropped
+                stats["errors"] += lane.errors
+                stats["depth"] += depth
+                stats["max_depth"] = max(stats["max_depth"], lane.max_depth)
+                stats["blocked_seconds"] += lane.blocked_seconds
+                stats["lane_depths"].append(depth)
+
+        return stats
+
+    def join(self):
+        """
+        Block until every queued callback has run.
+        """
+
+        for lane in self.lanes:
+            lane.queue.join()
+
+    def close(self):
+        """
+        Run the remaining callbacks and stop the lanes.
+        """
+
+        for lane in self.lanes:
+            lane.queue.put(_STOP)
+
+        for lane in self.lanes:
+            lane.thread.join()
+
+    def on_error(self, err: Exception):
+        print(err)
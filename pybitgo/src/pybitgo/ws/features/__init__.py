@@ -0,0 +1,169 @@
+from threading import Lock
+from typing import Dict, Optional
+
+import numpy as np
+
+from pybitgo.util import parse_time
+from pybitgo.ws.schema import Level2Snapshot
+
+COLUMNS = ["time", "mid", "spread", "imbalance", "bid_depth", "ask_depth", "vwap"]
+
+
+class BookSeries:
+    def __init__(self, capacity: int):
+        """
+        A preallocated ring of book features, one row per snapshot. Every row is
+        written twice, capacity rows apart, so that any window of recent rows is a
+        contiguous slice and can be returned as a view without copying.
+
+        Args:
+            capacity (int): The number of rows kept.
+        """
+
+        self.capacity = capacity
+        self.count = 0
+        self.data = np.full((len(COLUMNS), 2 * capacity), np.nan)
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, row: np.ndarray):
+        head = self.count % self.capacity
+        self.data[:, head] = row
+        self.data[:, head + self.capacity] = row
+        self.count += 1
+
+    def window(self, n: Optional[int] = None) -> np.ndarray:
+        """
+        Get a view of the last n rows (all rows if n is None), oldest first, shaped
+        (len(COLUMNS), n). The view is overwritten as the ring wraps around, so copy
+        it if it has to outlive the next capacity snapshots.
+
+        Args:
+            n (int): The number of rows.
+
+        Returns: np.ndarray
+        """
+
+        count = self.count
+        size = min(count, self.capacity)
+        n = size if n is None else min(n, size)
+        end = count % self.capacity + self.capacity if count >= self.capacity else count
+
+        return self.data[:, end - n : end]
+
+    def column(self, name: str, n: Optional[int] = None) -> np.ndarray:
+        """
+        Get a view of the last n values of a column, oldest first.
+        """
+
+        return self.window(n)[COLUMNS.index(name)]
+
+    def ewma(
+        self, name: str = "mid", alpha: float = 0.1, n: Optional[int] = None
+    ) -> float:
+        """
+        Get the exponentially weighted moving average of a column over the last n
+        rows, weighting the newest row by alpha.
+
+        Returns: float
+        """
+
+        values = self.column(name, n)
+
+        if not len(values):
+            return np.nan
+
+        weights = (1 - alpha) ** np.arange(len(values) - 1, -1, -1)
+
+        return float(np.dot(weights, values) / weights.sum())
+
+    def volatility(self, n: Optional[int] = None) -> float:
+        """
+        Get the standard deviation of mid log returns over the last n rows.
+
+        Returns: float
+        """
+
+        mid = self.column("mid", n)
+
+        if len(mid) < 3:
+            return np.nan
+
+        return float(np.std(np.diff(np.log(mid)), ddof=1))
+
+    def vwap(self, n: Optional[int] = None) -> float:
+        """
+        Get the depth-weighted average of the per-snapshot book VWAP over the last n
+        rows.
+
+        Returns: float
+        """
+
+        window = self.window(n)
+        depth = window[COLUMNS.index("bid_depth")] + window[COLUMNS.index("ask_depth")]
+        total = depth.sum()
+
+        if not total:
+            return np.nan
+
+        return float(np.nansum(window[COLUMNS.index("vwap")] * depth) / total)
+
+
+class BookFeatureStore:
+    def __init__(self, capacity: int = 4096, depth: int = 10):
+        """
+        Keeps a BookSeries per product. Register it with
+        BitGoWSClient.observe_level2(store.update) to fill it from every snapshot.
+
+        Args:
+            capacity (int): The number of snapshots kept per product.
+            depth (int): The number of levels per side used for depth, imbalance
+                and VWAP.
+        """
+
+        self.capacity = capacity
+        self.depth = depth
+        self.series: Dict[str, BookSeries] = {}
+        self.lock = Lock()
+
+    def __getitem__(self, product: str) -> BookSeries:
+        return self.series[product]
+
+    def update(self, msg: Level2Snapshot):
+        """
+        Append the features of a level2 snapshot.
+
+        Args:
+            msg (Level2Snapshot): The snapshot.
+        """
+
+        if (series := self.series.get(msg["product"])) is None:
+            with self.lock:
+                series = self.series.setdefault(
+                    msg["product"], BookSeries(self.capacity)
+                )
+
+        bids = np.array(msg["bids"][: self.depth], dtype=float).reshape(-1, 2)
+        asks = np.array(msg["asks"][: self.depth], dtype=float).reshape(-1, 2)
+        bid = bids[0, 0] if len(bids) else np.nan
+        ask = asks[0, 0] if len(asks) else np.nan
+        bid_depth = bids[:, 1].sum()
+        ask_depth = asks[:, 1].sum()
+        depth = bid_depth + ask_depth
+
+        series.append(
+            np.array(
+                [
+                    parse_time(msg["time"]),
+                    (bid + ask) / 2,
+                    ask - bid,
+                    (bid_depth - ask_depth) / depth if depth else np.nan,
+                    bid_depth,
+                    ask_depth,
+                    (bids[:, 0] @ bids[:, 1] + asks[:, 0] @ asks[:, 1]) / depth
+                    if depth
+                    else np.nan,
+                ]
+            )
+        )
@@ -0,0 +1,240 @@
+from threading import Event, Lock, Thread
+import time
+from typing import Dict, Iterable, List, Optional, TypedDict
+
+from pybitgo.util import Window, parse_time
+from pybitgo.ws.schema import Level2Snapshot
+
+
+class StaleFeedError(Exception):
+    pass
+
+
+class FeedStats(TypedDict):
+    product: str
+    snapshots: int
+    gaps: int
+    out_of_order: int
+    stale: bool
+    reason: Optional[str]
+    last_latency: float
+    last_interval: float
+    silence: float
+
+
+class _ProductFeed:
+    def __init__(self, window: int):
+
+        self.latencies = Window(window)
+        self.intervals = Window(window)
+        self.snapshots = 0
+        self.gaps = 0
+        self.out_of_order = 0
+        self.exchange_time = 0.0
+        self.local_time = 0.0
+        self.last_latency = float("nan")
+        self.last_interval = float("nan")
+        self.reason: Optional[str] = None
+
+
+class FeedMonitor:
+    def __init__(
+        self,
+        max_latency: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        window: int = 1024,
+        halt_on_stale: bool = False,
+    ):
+        """
+        Tracks the freshness of level2 snapshots per product. Register it with
+        BitGoWSClient.observe_level2(monitor.record) so that snapshots are measured
+        on the receive thread, before any dispatching.
+
+        Args:
+            max_latency (float): Seconds between the snapshot's time and its arrival
+                after which the product is stale.
+            max_interval (float): Seconds without a snapshot after which the product
+                is stale. is_stale() and guard() check this directly, on_stale is
+                only called for silence while the watchdog is running.
+            window (int): The number of samples kept for percentiles.
+            halt_on_stale (bool): Whether guard() rejects orders for stale products.
+        """
+
+        self.max_latency = max_latency
+        self.max_interval = max_interval
+        self.window = window
+        self.halt_on_stale = halt_on_stale
+        self.feeds: Dict[str, _ProductFeed] = {}
+        self.lock = Lock()
+        self.stopped = Event()
+
+    def record(self, msg: Level2Snapshot):
+        """
+        Record the arrival of a level2 snapshot.
+
+        Args:
+            msg (Level2Snapshot): The snapshot.
+        """
+
+        local_time = time.time()
+        exchange_time = parse_time(msg["time"])
+        product = msg["product"]
+
+        with self.lock:
+            if (feed := self.feeds.get(product)) is None:
+                feed = self.feeds[product] = _ProductFeed(self.window)
+
+            if exchange_time < feed.exchange_time:
+                feed.out_of_order += 1
+
+            if feed.snapshots:
+                feed.last_interval = local_time - feed.local_time
+                feed.intervals.append(feed.last_interval)
+
+                if self.max_interval is not None and (
+                    feed.last_interval > self.max_interval
+                ):
+                    feed.gaps += 1
+
+            feed.last_latency = local_time - exchange_time
+            feed.latencies.append(feed.last_latency)
+            feed.exchange_time = max(feed.exchange_time, exchange_time)
+            feed.local_time = local_time
+            feed.snapshots += 1
+
+            reason = None
+            if self.max_latency is not None and feed.last_latency > self.max_latency:
+                reason = "latency"
+
+            changed = reason != feed.reason
+            feed.reason = reason
+
+        if changed:
+            if reason is None:
+                self.on_fresh(product)
+            else:
+                self.on_stale(product, reason)
+
+    def check(self) -> List[str]:
+        """
+        Mark products that have been silent for longer than max_interval as stale.
+
+        Returns: List[str], the stale products
+        """
+
+        now = time.time()
+        silent = []
+
+        with self.lock:
+            for product, feed in self.feeds.items():
+                if (
+                    self.max_interval is not None
+                    and feed.reason != "silence"
+                    and now - feed.local_time > self.max_interval
+                ):
+                    feed.reason = "silence"
+                    silent.append(product)
+
+            stale = [p for p, feed in self.feeds.items() if feed.reason is not None]
+
+        for product in silent:
+            self.on_stale(product, "silence")
+
+        return stale
+
+    def start(self, interval: float = 1.0) -> Thread:
+        """
+        Run check() every interval seconds on a daemon thread until stop().
+
+        Args:
+            interval (float): Seconds between checks.
+
+        Returns: Thread
+        """
+
+        self.stopped.clear()
+
+        def run():
+            while not self.stopped.wait(interval):
+                self.check()
+
+        thread = Thread(target=run, name="FeedMonitor", daemon=True)
+        thread.start()
+
+        return thread
+
+    def stop(self):
+        self.stopped.set()
+
+    def is_stale(self, product: str) -> bool:
+        """
+        Whether the product is stale. Products never seen are not stale. Silence
+        is checked here too, so it counts even if the watchdog is not running.
+        """
+
+        feed = self.feeds.get(product)
+
+        if feed is None:
+            return False
+
+        return feed.reason is not None or (
+            self.max_interval is not None
+            and time.time() - feed.local_time > self.max_interval
+        )
+
+    def guard(self, product: str):
+        """
+        Raise StaleFeedError if halt_on_stale is set and the product is stale.
+        """
+
+        if self.halt_on_stale and self.is_stale(product):
+            raise StaleFeedError(f"level2 feed for {product} is stale")
+
+    def stats(self, product: str) -> FeedStats:
+        """
+        Get the current counters for a product.
+
+        Returns: FeedStats
+        """
+
+        with self.lock:
+            feed = self.feeds[product]
+            stale = self.is_stale(product)
+
+            return {
+                "product": product,
+                "snapshots": feed.snapshots,
+                "gaps": feed.gaps,
+                "out_of_order": feed.out_of_order,
+                "stale": stale,
+                "reason": feed.reason or ("silence" if stale else None),
+                "last_latency": feed.last_latency,
+                "last_interval": feed.last_interval,
+                "silence": time.time() - feed.local_time,
+            }
+
+    def latency_percentiles(
+        self, product: str, qs: Iterable[float] = (50, 90, 99)
+    ) -> Dict[float, float]:
+        """
+        Get rolling percentiles of exchange-to-local latency in seconds.
+        """
+
+        with self.lock:
+            return self.feeds[product].latencies.percentiles(qs)
+
+    def interval_percentiles(
+        self, product: str, qs: Iterable[float] = (50, 90, 99)
+    ) -> Dict[float, float]:
+        """
+        Get rolling percentiles of the interval between snapshots in seconds.
+        """
+
+        with self.lock:
+            return self.feeds[product].intervals.percentiles(qs)
+
+    def on_stale(self, product: str, reason: str):
+        print(f"{product} level2 feed is stale ({reason})")
+
+    def on_fresh(self, product: str):
+        print(f"{product} level2 feed is fresh")
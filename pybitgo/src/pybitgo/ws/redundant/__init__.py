@@ -0,0 +1,288 @@
+from abc import abstractmethod
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypedDict
+
+from pybitgo.util import parse_time
+from pybitgo.ws.dispatch import CallbackDispatcher
+from pybitgo.ws.schema import Level2Error, Level2Snapshot, Order
+from pybitgo.ws.trade import BitGoWSClient
+
+
+class ConnectionStats(TypedDict):
+    index: int
+    connected: bool
+    reconnects: int
+    received: int
+    wins: int
+    duplicates: int
+    win_rate: float
+    mean_lag: float
+    max_lag: float
+    mean_latency: float
+
+
+class _Leg(BitGoWSClient):
+    def __init__(
+        self, parent: "RedundantBitGoWSClient", index: int, token: str, url: str
+    ):
+
+        super().__init__(token, url)
+        self.on_close = self.on_disconnect
+        self.parent = parent
+        self.index = index
+        self.connected = False
+        self.reconnects = 0
+        self.received = 0
+        self.wins = 0
+        self.level2_wins = 0
+        self.duplicates = 0
+        self.lag_count = 0
+        self.lag_sum = 0.0
+        self.max_lag = 0.0
+        self.latency_sum = 0.0
+
+    def on_open(self, ws):
+        self.connected = True
+        super().on_open(ws)
+
+    def on_disconnect(self, *_):
+        self.connected = False
+
+    def on_error(self, _, err):
+        self.parent.on_error(self.index, err)
+
+    def on_level2_snapshot(self, msg: Level2Snapshot):
+        self.parent.merge_level2_snapshot(self, msg)
+
+    def on_level2_error(self, msg: Level2Error):
+        self.parent.merge(self, ("level2", msg["message"], msg["time"]), msg)
+
+    def on_order(self, msg: Order):
+        self.parent.merge(
+            self,
+            (
+                "order",
+                msg["orderId"],
+                msg["status"],
+                msg.get("traddeId"),
+                msg.get("cummulativeQuantity"),
+            ),
+            msg,
+        )
+
+
+class RedundantBitGoWSClient:
+    def __init__(
+        self,
+        token: str,
+        url: str = "wss://app.bitgo.com/api/prime/trading/v1/ws",
+        connections: int = 2,
+        dispatcher: Optional[CallbackDispatcher] = None,
+        reconnect_delay: float = 1.0,
+        dedup_size: int = 4096,
+    ):
+        """
+        Keeps several identical BitGoWSClient connections open and merges their
+        streams. Level2 snapshots are deduplicated by product and time, order
+        updates by orderId, status and fill, and whichever copy arrives first is
+        delivered. A dropped connection is reconnected while the others keep the
+        stream going.
+
+        The merged callbacks always run on a dispatcher, so a slow callback never
+        stalls the receive threads. They are submitted under a lock shared by all
+        connections to keep per-product ordering, so the dispatcher should not use
+        overflow="block".
+
+        Args:
+            token (str): The access token.
+            url (str): The WebSocket url.
+            connections (int): The number of redundant connections.
+            dispatcher (CallbackDispatcher): Runs the merged callbacks, by default
+                a CallbackDispatcher().
+            reconnect_delay (float): Seconds to wait before reconnecting.
+            dedup_size (int): The number of order and error keys remembered.
+        """
+
+        assert connections > 0, "connections must be positive"
+
+        self.legs = [_Leg(self, i, token, url) for i in range(connections)]
+        self.dispatcher = dispatcher or CallbackDispatcher()
+        self.reconnect_delay = reconnect_delay
+        self.dedup_size = dedup_size
+        self.level2_observers: List[Callable[[Level2Snapshot], None]] = []
+        self.level2_times: Dict[str, Tuple[float, float]] = {}
+        self.seen: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.lock = Lock()
+        self.stopped = Event()
+
+    def subscribe_level2(
+        self, account_id: str, product_id: str
+    ) -> "RedundantBitGoWSClient":
+        """
+        Subscribe every connection to the level2 channel for a product.
+        """
+
+        for leg in self.legs:
+            leg.subscribe_level2(account_id, product_id)
+
+        return self
+
+    def subscribe_orders(self, account_id: str) -> "RedundantBitGoWSClient":
+        """
+        Subscribe every connection to the orders channel.
+        """
+
+        for leg in self.legs:
+            leg.subscribe_orders(account_id)
+
+        return self
+
+    def observe_level2(
+        self, observer: Callable[[Level2Snapshot], None]
+    ) -> "RedundantBitGoWSClient":
+        """
+        Call observer with every merged level2 snapshot before it is dispatched.
+        """
+
+        self.level2_observers.append(observer)
+
+        return self
+
+    def start(self, **kwargs) -> List[Thread]:
+        """
+        Run every connection on its own daemon thread, reconnecting until close().
+
+        Args:
+            **kwargs: Passed through to run_forever.
+
+        Returns: List[Thread]
+        """
+
+        self.stopped.clear()
+        threads = []
+
+        for leg in self.legs:
+
+            def run(leg=leg):
+                while not self.stopped.is_set():
+                    leg.run_forever(**kwargs)
+
+                    if not self.stopped.wait(self.reconnect_delay):
+                        leg.reconnects += 1
+
+            thread = Thread(target=run, name=f"BitGoWSClient-{leg.index}", daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        return threads
+
+    def run_forever(self, **kwargs):
+        """
+        Start every connection and block until close().
+        """
+
+        for thread in self.start(**kwargs):
+            thread.join()
+
+    def close(self):
+        self.stopped.set()
+
+        for leg in self.legs:
+            leg.close()
+
+    def stats(self) -> List[ConnectionStats]:
+        """
+        Get win-rate and latency statistics per connection. Lag is how far a
+        connection trailed the first copy of a message, latency is how far the
+        first copies it delivered trailed the exchange time of level2 snapshots.
+
+        Returns: List[ConnectionStats]
+        """
+
+        with self.lock:
+            return [
+                {
+                    "index": leg.index,
+                    "connected": leg.connected,
+                    "reconnects": leg.reconnects,
+                    "received": leg.received,
+                    "wins": leg.wins,
+                    "duplicates": leg.duplicates,
+                    "win_rate": leg.wins / leg.received if leg.received else 0.0,
+                    "mean_lag": leg.lag_sum / leg.lag_count if leg.lag_count else 0.0,
+                    "max_lag": leg.max_lag,
+                    "mean_latency": (
+                        leg.latency_sum / leg.level2_wins if leg.level2_wins else 0.0
+                    ),
+                }
+                for leg in self.legs
+            ]
+
+    def merge_level2_snapshot(self, leg: _Leg, msg: Level2Snapshot):
+        now = time.time()
+        exchange_time = parse_time(msg["time"])
+
+        with self.lock:
+            leg.received += 1
+            last = self.level2_times.get(msg["product"])
+
+            if last is not None and exchange_time <= last[0]:
+                first = last[1] if exchange_time == last[0] else None
+                self.record_duplicate(leg, now, first)
+                return
+
+            self.level2_times[msg["product"]] = (exchange_time, now)
+            leg.wins += 1
+            leg.level2_wins += 1
+            leg.latency_sum += now - exchange_time
+
+            for observer in self.level2_observers:
+                observer(msg)
+
+            self.dispatcher.submit(msg["product"], self.on_level2_snapshot, msg)
+
+    def merge(self, leg: _Leg, key: Hashable, msg: Any):
+        now = time.time()
+
+        with self.lock:
+            leg.received += 1
+
+            if key in self.seen:
+                self.record_duplicate(leg, now, self.seen[key])
+                return
+
+            self.seen[key] = now
+            if len(self.seen) > self.dedup_size:
+                self.seen.popitem(last=False)
+
+            leg.wins += 1
+
+            if key[0] == "order":
+                self.dispatcher.submit(msg["product"], self.on_order, msg, False)
+            else:
+                self.dispatcher.submit("level2", self.on_level2_error, msg, False)
+
+    def record_duplicate(self, leg: _Leg, now: float, first: Optional[float]):
+        leg.duplicates += 1
+
+        if first is not None:
+            leg.lag_count += 1
+            leg.lag_sum += now - first
+            leg.max_lag = max(leg.max_lag, now - first)
+
+    def on_error(self, index: int, err: Exception):
+        print(index, err)
+
+    @abstractmethod
+    def on_level2_snapshot(self, msg: Level2Snapshot):
+        print(msg)
+
+    @abstractmethod
+    def on_level2_error(self, msg: Level2Error):
+        print(msg)
+
+    @abstractmethod
+    def on_order(self, msg: Order):
+        print(msg)
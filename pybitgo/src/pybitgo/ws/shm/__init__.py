@@ -0,0 +1,270 @@
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from time import monotonic
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+from pybitgo.util import parse_time
+from pybitgo.ws.schema import Level2Error, Level2Snapshot
+from pybitgo.ws.trade import BitGoWSClient
+
+# seq, time, number of bids, number of asks, depth
+_HEADER = Struct("QdQQQ")
+_SEQ = Struct("Q")
+_BOOK = Struct("dQQ")
+
+# segments created in this process, which the resource tracker must keep tracking
+_owned: Set[str] = set()
+
+
+class SharedBookSnapshot(NamedTuple):
+    seq: int
+    time: float
+    bids: List[Tuple[float, float]]
+    asks: List[Tuple[float, float]]
+
+
+def segment_name(prefix: str, product: str) -> str:
+    """
+    Get the shared memory name of a product's book. Product names such as
+    TBTC-TUSD* are hex encoded since not every character is valid in a name.
+    """
+
+    return f"{prefix}_{product.encode().hex()}"
+
+
+def _pairs(flat: List[float]) -> List[Tuple[float, float]]:
+    return list(zip(flat[::2], flat[1::2]))
+
+
+class SharedBookWriter:
+    def __init__(
+        self, products: Iterable[str], depth: int = 10, prefix: str = "pybitgo"
+    ):
+        """
+        Publishes the top depth levels of each product's level2 book to shared
+        memory. Each product has its own segment guarded by a seqlock: the sequence
+        number is odd while a snapshot is being written.
+
+        Prices and sizes are stored as float64.
+
+        Args:
+            products (Iterable[str]): The products to publish.
+            depth (int): The number of levels kept per side.
+            prefix (str): The prefix of the segment names.
+        """
+
+        self.depth = depth
+        self.segments: Dict[str, SharedMemory] = {}
+        self.levels: Dict[str, memoryview] = {}
+        self.seqs: Dict[str, int] = {}
+
+        for product in products:
+            segment = SharedMemory(
+                segment_name(prefix, product),
+                create=True,
+                size=_HEADER.size + 32 * depth,
+            )
+            _owned.add(segment._name)
+            _HEADER.pack_into(segment.buf, 0, 0, 0.0, 0, 0, depth)
+            self.segments[product] = segment
+            self.levels[product] = segment.buf[_HEADER.size :].cast("d")
+            self.seqs[product] = 0
+
+    def publish(self, msg: Level2Snapshot):
+        """
+        Write a level2 snapshot. Snapshots for other products are ignored.
+
+        Args:
+            msg (Level2Snapshot): The snapshot.
+        """
+
+        if (segment := self.segments.get(msg["product"])) is None:
+            return
+
+        bids = array("d", (float(x) for lvl in msg["bids"][: self.depth] for x in lvl))
+        asks = array("d", (float(x) for lvl in msg["asks"][: self.depth] for x in lvl))
+        time = parse_time(msg["time"])
+        levels = self.levels[msg["product"]]
+        seq = self.seqs[msg["product"]]
+
+        _SEQ.pack_into(segment.buf, 0, seq + 1)
+        _BOOK.pack_into(segment.buf, _SEQ.size, time, len(bids) // 2, len(asks) // 2)
+        levels[: len(bids)] = bids
+        levels[2 * self.depth : 2 * self.depth + len(asks)] = asks
+        _SEQ.pack_into(segment.buf, 0, seq + 2)
+
+        self.seqs[msg["product"]] = seq + 2
+
+    def close(self, unlink: bool = True):
+        """
+        Detach from the segments, removing them unless unlink is False.
+        """
+
+        for product, segment in self.segments.items():
+            self.levels[product].release()
+            segment.close()
+
+            if unlink:
+                segment.unlink()
+                _owned.discard(segment._name)
+
+
+class SharedBookReader:
+    def __init__(
+        self, products: Iterable[str], prefix: str = "pybitgo", timeout: float = 1.0
+    ):
+        """
+        Reads books published by a SharedBookWriter in another process. Reads
+        never take a lock: a read that overlaps a write is retried.
+
+        Args:
+            products (Iterable[str]): The products to read.
+            prefix (str): The prefix of the segment names.
+            timeout (float): Seconds to retry a read while a write is in progress
+                before giving up, e.g. because the writer died mid-publish.
+        """
+
+        self.timeout = timeout
+        self.segments: Dict[str, SharedMemory] = {}
+        self.levels: Dict[str, memoryview] = {}
+        self.depths: Dict[str, int] = {}
+
+        for product in products:
+            segment = SharedMemory(segment_name(prefix, product))
+
+            # attaching registers the segment, which would unlink it when this
+            # process exits even though the writer still owns it
+            if segment._name not in _owned:
+                resource_tracker.unregister(segment._name, "shared_memory")
+
+            self.segments[product] = segment
+            self.levels[product] = segment.buf[_HEADER.size :].cast("d")
+            self.depths[product] = _HEADER.unpack_from(segment.buf, 0)[4]
+
+    def read(self, product: str) -> SharedBookSnapshot:
+        """
+        Copy a consistent snapshot of a product's book.
+
+        Args:
+            product (str): The product.
+
+        Returns: SharedBookSnapshot
+        """
+
+        buf = self.segments[product].buf
+        levels = self.levels[product]
+        depth = self.depths[product]
+
+        while True:
+            seq = self._stable_seq(product)
+
+            time, n_bids, n_asks = _BOOK.unpack_from(buf, _SEQ.size)
+            bids = levels[: 2 * min(n_bids, depth)].tolist()
+            asks = levels[2 * depth : 2 * (depth + min(n_asks, depth))].tolist()
+
+            if _SEQ.unpack_from(buf, 0)[0] == seq:
+                return SharedBookSnapshot(seq, time, _pairs(bids), _pairs(asks))
+
+    def view(self, product: str) -> Tuple[int, memoryview, memoryview]:
+        """
+        Get zero-copy views of a product's bids and asks as flat
+        [price, size, price, size, ...] float64 memoryviews. The views may change
+        underneath the caller, so call validate with the returned sequence number
+        once done reading and discard the result if it returns False.
+
+        Args:
+            product (str): The product.
+
+        Returns: Tuple[int, memoryview, memoryview], the sequence number, bids and asks
+        """
+
+        buf = self.segments[product].buf
+        levels = self.levels[product]
+        depth = self.depths[product]
+
+        seq = self._stable_seq(product)
+        _, n_bids, n_asks = _BOOK.unpack_from(buf, _SEQ.size)
+
+        return (
+            seq,
+            levels[: 2 * min(n_bids, depth)],
+            levels[2 * depth : 2 * (depth + min(n_asks, depth))],
+        )
+
+    def _stable_seq(self, product: str) -> int:
+        buf = self.segments[product].buf
+        deadline = None
+
+        while (seq := _SEQ.unpack_from(buf, 0)[0]) & 1:
+            deadline = deadline or monotonic() + self.timeout
+
+            if monotonic() > deadline:
+                raise Exception(
+                    f"{product} book is still being written after {self.timeout}s, "
+                    "the writer may have died mid-publish"
+                )
+
+        return seq
+
+    def validate(self, product: str, seq: int) -> bool:
+        """
+        Whether the book has not been written since seq was read.
+        """
+
+        return _SEQ.unpack_from(self.segments[product].buf, 0)[0] == seq
+
+    def seq(self, product: str) -> int:
+        """
+        Get the sequence number of a product's book, e.g. to poll for updates.
+        """
+
+        return _SEQ.unpack_from(self.segments[product].buf, 0)[0]
+
+    def close(self):
+        """
+        Detach from the segments. Release any views returned by view() first.
+        """
+
+        for product, segment in self.segments.items():
+            self.levels[product].release()
+            segment.close()
+
+
+class SharedBookPublisher(BitGoWSClient):
+    def __init__(
+        self,
+        token: str,
+        account_id: str,
+        products: Iterable[str],
+        depth: int = 10,
+        prefix: str = "pybitgo",
+        url: str = "wss://app.bitgo.com/api/prime/trading/v1/ws",
+    ):
+        """
+        A level2 subscription that publishes every snapshot to shared memory, so
+        that one process can feed any number of SharedBookReaders.
+
+        Args:
+            token (str): The access token.
+            account_id (str): The id of the trading account.
+            products (Iterable[str]): The products to subscribe to and publish.
+            depth (int): The number of levels kept per side.
+            prefix (str): The prefix of the segment names.
+            url (str): The WebSocket url.
+        """
+
+        super().__init__(token, url)
+        products = list(products)
+        self.writer = SharedBookWriter(products, depth, prefix)
+        self.observe_level2(self.writer.publish)
+
+        for product in products:
+            self.subscribe_level2(account_id, product)
+
+    def on_level2_snapshot(self, msg: Level2Snapshot):
+        pass
+
+    def on_level2_error(self, msg: Level2Error):
+        print(msg)
@@ -1,6 +1,8 @@
 from abc import abstractmethod
 import json
-from typing import List
+from threading import Thread
+from typing import Any, Callable, Hashable, List, Optional
+from pybitgo.ws.dispatch import CallbackDispatcher
 from pybitgo.ws.schema import Level2Error, Level2Snapshot, Order
 
 from websocket import ABNF, WebSocketApp
@@ -8,7 +10,10 @@ from websocket import ABNF, WebSocketApp
 
 class BitGoWSClient(WebSocketApp):
     def __init__(
-        self, token: str, url: str = "wss://app.bitgo.com/api/prime/trading/v1/ws"
+        self,
+        token: str,
+        url: str = "wss://app.bitgo.com/api/prime/trading/v1/ws",
+        dispatcher: Optional[CallbackDispatcher] = None,
     ):
 
         super().__init__(
@@ -20,6 +25,8 @@ class BitGoWSClient(WebSocketApp):
             on_ping=self.on_ping,
         )
         self.subscriptions: List[str] = []
+        self.dispatcher = dispatcher
+        self.level2_observers: List[Callable[[Level2Snapshot], None]] = []
 
     def subscribe_level2(self, account_id: str, product_id: str) -> "BitGoWSClient":
         """
@@ -58,6 +65,53 @@ class BitGoWSClient(WebSocketApp):
 
         return self
 
+    def observe_level2(
+        self, observer: Callable[[Level2Snapshot], None]
+    ) -> "BitGoWSClient":
+        """
+        Call observer with every level2 snapshot on the receive thread, before the
+        snapshot is dispatched. Observers must be cheap, e.g. FeedMonitor.record.
+        """
+
+        self.level2_observers.append(observer)
+
+        return self
+
+    def start(self, **kwargs) -> Thread:
+        """
+        Run the connection on a dedicated daemon thread. Receiving and answering
+        PINGs happen on this thread, so pair it with a dispatcher to keep slow
+        callbacks from missing the keep-alive.
+
+        Args:
+            **kwargs: Passed through to run_forever.
+
+        Returns: Thread
+        """
+
+        thread = Thread(
+            target=self.run_forever, kwargs=kwargs, name="BitGoWSClient", daemon=True
+        )
+        thread.start()
+
+        return thread
+
+    def dispatch(
+        self,
+        key: Hashable,
+        callback: Callable[[Any], None],
+        msg: Any,
+        droppable: bool = True,
+    ):
+        """
+        Run a callback inline, or hand it to the dispatcher if there is one.
+        """
+
+        if self.dispatcher is None:
+            callback(msg)
+        else:
+            self.dispatcher.submit(key, callback, msg, droppable)
+
     def on_open(self, _):
         for subscription in self.subscriptions:
             self.send(subscription)
@@ -70,13 +124,16 @@ class BitGoWSClient(WebSocketApp):
 
         if msg_json["channel"] == "level2":
             if msg_json["type"] == "snapshot":
-                self.on_level2_snapshot(msg_json)
+                for observer in self.level2_observers:
+                    observer(msg_json)
+
+                self.dispatch(msg_json["product"], self.on_level2_snapshot, msg_json)
 
             elif msg_json["type"] == "error":
-                self.on_level2_error(msg_json)
+                self.dispatch("level2", self.on_level2_error, msg_json, False)
 
         elif msg_json["channel"] == "order":
-            self.on_order(msg_json)
+            self.dispatch(msg_json["product"], self.on_order, msg_json, False)
 
     def on_error(self, _, err):
         print(err)
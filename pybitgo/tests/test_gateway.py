@@ -0,0 +1,126 @@
+from contextlib import redirect_stderr
+from datetime import datetime, timezone
+from io import StringIO
+import json
+import os
+import tempfile
+from threading import Thread
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pybitgo.cli import main, query
+from pybitgo.gateway import Gateway
+
+
+class TestGateway(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "pybitgo.sock")
+        self.gateway = Gateway("token")
+        self.gateway.client = MagicMock()
+        self.thread = Thread(target=self.gateway.serve_forever, args=(self.path,))
+        self.thread.start()
+
+        while not os.path.exists(self.path):
+            time.sleep(0.01)
+
+    def tearDown(self):
+        self.gateway.shutdown()
+        self.thread.join()
+
+    def test_ping(self):
+        self.assertEqual(query("ping", {}, self.path), "pong")
+
+    def test_balances(self):
+        balance = {"currency": "BTC", "balance": "1"}
+        self.gateway.client.get_account_balance.return_value = iter([balance])
+
+        self.assertEqual(
+            query("balances", {"account_id": "account"}, self.path), [balance]
+        )
+        self.gateway.client.get_account_balance.assert_called_once_with("account")
+
+    def test_open_orders(self):
+        self.gateway.client.list_orders.return_value = iter(
+            [{"id": "1", "status": "opened"}, {"id": "2", "status": "completed"}]
+        )
+
+        self.assertEqual(
+            query("orders", {"account_id": "account", "open": True}, self.path),
+            [{"id": "1", "status": "opened"}],
+        )
+
+    def test_orders_limit(self):
+        orders = ({"id": str(i), "status": "opened"} for i in range(16))
+        self.gateway.client.list_orders.return_value = orders
+
+        result = query("orders", {"account_id": "account", "limit": 5}, self.path)
+        self.assertEqual([o["id"] for o in result], ["0", "1", "2", "3", "4"])
+        self.assertEqual(next(orders)["id"], "5")
+
+    def _publish_book(self):
+        self.gateway.ws.legs[0].on_message(
+            None,
+            json.dumps(
+                {
+                    "channel": "level2",
+                    "type": "snapshot",
+                    "product": "BTC-USD",
+                    "time": datetime.now(timezone.utc).isoformat(),
+                    "bids": [["1", "1"]],
+                    "asks": [],
+                }
+            ),
+        )
+        self.gateway.ws.dispatcher.join()
+
+    def test_cached_book(self):
+        self._publish_book()
+
+        book = query("book", {"account_id": "account", "product": "BTC-USD"}, self.path)
+        self.assertEqual(book["bids"], [["1", "1"]])
+        self.gateway.client.get_level2.assert_not_called()
+
+    def test_stale_book_falls_back_to_rest(self):
+        self.gateway.monitor.max_interval = 0.01
+        self.gateway.monitor.on_stale = lambda *_: None
+        self.gateway.client.get_level2.return_value = {"bids": [["2", "1"]]}
+        self._publish_book()
+        time.sleep(0.02)
+
+        book = query("book", {"account_id": "account", "product": "BTC-USD"}, self.path)
+        self.assertEqual(book["bids"], [["2", "1"]])
+
+    def test_updates_are_bounded(self):
+        self.gateway.max_updates = 2
+
+        for order_id in ["1", "2", "1", "3"]:
+            self.gateway.ws.on_order({"orderId": order_id, "accountId": "account"})
+
+        self.assertEqual(list(self.gateway.updates), ["1", "3"])
+
+    def test_refuses_running_socket(self):
+        self.assertRaises(Exception, Gateway("token").serve_forever, self.path)
+        self.assertEqual(query("ping", {}, self.path), "pong")
+
+    def test_errors(self):
+        self.assertRaises(Exception, query, "missing", {}, self.path)
+
+
+class TestCLI(TestCase):
+    def test_serve_usage_errors(self):
+        token = os.environ.pop("BITGO_ACCESS_TOKEN", None)
+
+        try:
+            for argv in [
+                ["serve", "--token", "token", "--orders"],
+                ["serve", "--account", "account"],
+            ]:
+                with self.assertRaises(SystemExit) as ctx, redirect_stderr(StringIO()):
+                    main(argv)
+
+                self.assertEqual(ctx.exception.code, 2)
+
+        finally:
+            if token is not None:
+                os.environ["BITGO_ACCESS_TOKEN"] = token
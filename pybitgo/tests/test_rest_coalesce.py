@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pybitgo.rest.trade import BitGoRESTClient
+
+
+def _slow_response(*_):
+    time.sleep(0.05)
+    res = MagicMock()
+    res.json.return_value = {"time": "", "product": "BTC-USD", "bids": [], "asks": []}
+
+    return res
+
+
+class TestRestCoalesce(TestCase):
+    def test_concurrent_gets_share_request(self):
+        client = BitGoRESTClient("token", coalesce=True)
+
+        with patch.object(client, "request", side_effect=_slow_response) as request:
+            with ThreadPoolExecutor(8) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: client.get_level2("account", "BTC-USD"), range(8)
+                    )
+                )
+
+        self.assertEqual(request.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_ttl(self):
+        client = BitGoRESTClient("token", coalesce=True, coalesce_ttl=60)
+
+        with patch.object(client, "request", side_effect=_slow_response) as request:
+            client.get_level2("account", "BTC-USD")
+            client.get_level2("account", "BTC-USD")
+            client.get_level2("account", "ETH-USD")
+
+        self.assertEqual(request.call_count, 2)
+
+    def test_expired_results_are_evicted(self):
+        client = BitGoRESTClient("token", coalesce=True, coalesce_ttl=0.01)
+
+        with patch.object(client, "request", return_value=MagicMock()):
+            for i in range(100):
+                client.get_level1("account", str(i))
+
+            time.sleep(0.02)
+            client.get_level1("account", "last")
+
+        self.assertEqual(
+            list(client.flights), [("/accounts/account/products/last/level1", ())]
+        )
+
+    def test_writes_invalidate_account(self):
+        client = BitGoRESTClient("token", coalesce=True, coalesce_ttl=60)
+        res = MagicMock(status_code=200)
+        res.json.return_value = {"data": []}
+
+        with patch.object(client.session, "request", return_value=res) as request:
+            list(client.get_account_balance("account"))
+            list(client.get_account_balance("other"))
+            client.cancel_order("account", "1")
+            list(client.get_account_balance("account"))
+            list(client.get_account_balance("other"))
+
+        self.assertEqual(request.call_count, 4)
+
+    def test_orders_are_not_cached(self):
+        client = BitGoRESTClient("token", coalesce=True, coalesce_ttl=60)
+
+        with patch.object(client, "request", side_effect=_slow_response) as request:
+            client.get_order("account", "1")
+            client.get_order("account", "1")
+
+        self.assertEqual(request.call_count, 2)
+        self.assertFalse(client.flights)
+
+    def test_errors_are_not_reused(self):
+        client = BitGoRESTClient("token", coalesce=True, coalesce_ttl=60)
+
+        with patch.object(client, "request", side_effect=Exception("down")):
+            self.assertRaises(Exception, client.get_level1, "account", "BTC-USD")
+
+        with patch.object(client, "request", side_effect=_slow_response) as request:
+            client.get_level1("account", "BTC-USD")
+
+        self.assertEqual(request.call_count, 1)
+
+    def test_writes_are_not_coalesced(self):
+        client = BitGoRESTClient("token", coalesce=True, coalesce_ttl=60)
+
+        with patch.object(client, "request", side_effect=_slow_response) as request:
+            with ThreadPoolExecutor(4) as executor:
+                for _ in range(4):
+                    executor.submit(
+                        client.place_market_order,
+                        "account",
+                        "BTC-USD",
+                        "buy",
+                        "1",
+                        "USD",
+                    )
+
+        self.assertEqual(request.call_count, 4)
@@ -0,0 +1,80 @@
+import json
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pybitgo.rest.order import OrderEntry
+
+
+class TestRestOrder(TestCase):
+    def test_limit_order_body(self):
+        entry = OrderEntry("token", "account", "http://localhost")
+        res = MagicMock(status_code=200)
+        res.json.return_value = {"id": "order"}
+
+        with patch.object(entry.session, "post", return_value=res) as post:
+            self.assertEqual(
+                entry.place_limit_order("BTC-USD", "buy", "1000", "USD", "20000"),
+                {"id": "order"},
+            )
+            entry.place_limit_order(
+                "BTC-USD", "sell", "1", "BTC", "21000", 'a"b', duration=5
+            )
+
+        self.assertEqual(post.call_args_list[0][0][0], entry.orders_url)
+        self.assertEqual(
+            json.loads(post.call_args_list[0][1]["data"]),
+            {
+                "product": "BTC-USD",
+                "type": "limit",
+                "side": "buy",
+                "quantity": "1000",
+                "quantityCurrency": "USD",
+                "limitPrice": "20000",
+            },
+        )
+        self.assertEqual(
+            json.loads(post.call_args_list[1][1]["data"]),
+            {
+                "product": "BTC-USD",
+                "type": "limit",
+                "side": "sell",
+                "quantity": "1",
+                "quantityCurrency": "BTC",
+                "limitPrice": "21000",
+                "clientOrderId": 'a"b',
+                "duration": 5,
+            },
+        )
+        self.assertEqual(entry.latencies.count, 2)
+
+    def test_market_order_body(self):
+        entry = OrderEntry("token", "account", "http://localhost")
+        res = MagicMock(status_code=200)
+        res.json.return_value = {"id": "order"}
+
+        with patch.object(entry.session, "post", return_value=res) as post:
+            entry.place_market_order("BTC-USD", "buy", "1000", "USD", "client")
+
+        self.assertEqual(
+            json.loads(post.call_args[1]["data"]),
+            {
+                "product": "BTC-USD",
+                "type": "market",
+                "side": "buy",
+                "quantity": "1000",
+                "quantityCurrency": "USD",
+                "clientOrderId": "client",
+            },
+        )
+
+    def test_rejected_orders_are_not_timed(self):
+        entry = OrderEntry("token", "account", "http://localhost")
+        res = MagicMock(status_code=400)
+        res.json.return_value = {"error": "rejected"}
+
+        with patch.object(entry.session, "post", return_value=res):
+            self.assertRaises(
+                Exception, entry.place_market_order, "BTC-USD", "buy", "1", "USD"
+            )
+
+        self.assertEqual(entry.latencies.count, 0)
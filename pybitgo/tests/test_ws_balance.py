@@ -0,0 +1,120 @@
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pybitgo.ws.balance import BalanceEngine
+
+
+def _balance(currency: str, balance: str, held: str = "0"):
+    return {
+        "currencyId": currency,
+        "currency": currency,
+        "balance": balance,
+        "heldBalance": held,
+        "tradableBalance": str(Decimal(balance) - Decimal(held)),
+    }
+
+
+def _order(status: str, side: str = "buy", **fill):
+    return {
+        "channel": "order",
+        "time": "2022-07-14T18:35:41.000Z",
+        "accountId": "account",
+        "orderId": "1",
+        "clientOrderId": "",
+        "product": "BTC-USD",
+        "status": status,
+        "type": "limit",
+        "side": side,
+        "quantity": "1000" if side == "buy" else "1",
+        **fill,
+    }
+
+
+class TestWSBalance(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.list_products.return_value = [
+            {"name": "BTC-USD", "baseCurrency": "BTC", "quoteCurrency": "USD"}
+        ]
+        self.client.get_account_balance.return_value = [
+            _balance("BTC", "2"),
+            _balance("USD", "5000"),
+        ]
+        self.engine = BalanceEngine(self.client, "account").seed()
+        self.engine.on_drift = lambda _: None
+
+    def test_buy_fill_and_complete(self):
+        self.engine.on_order(_order("opened"))
+        self.assertEqual(self.engine.tradable("USD"), Decimal("4000"))
+
+        fill = {"traddeId": "t1", "fillQuantity": "0.01", "fillPrice": "20000"}
+        self.engine.on_order(_order("filled", **fill))
+        self.engine.on_order(_order("filled", **fill))
+
+        self.assertEqual(self.engine.get_balance("USD")["balance"], "4800.00")
+        self.assertEqual(self.engine.get_balance("USD")["heldBalance"], "800.00")
+        self.assertEqual(self.engine.tradable("BTC"), Decimal("2.01"))
+
+        self.engine.on_order(_order("completed"))
+        self.assertEqual(self.engine.tradable("USD"), Decimal("4800"))
+        self.assertFalse(self.engine.holds)
+
+    def test_sell_cancel(self):
+        self.engine.on_order(_order("opened", side="sell"))
+        self.assertFalse(self.engine.has_tradable("BTC", "1.5"))
+
+        self.engine.on_order(_order("canceled", side="sell"))
+        self.assertTrue(self.engine.has_tradable("BTC", "1.5"))
+
+    def test_reconcile_reports_drift(self):
+        self.engine.on_order(_order("opened"))
+        drifts = self.engine.reconcile()
+
+        self.assertEqual(
+            drifts,
+            [
+                {
+                    "currency": "USD",
+                    "field": "heldBalance",
+                    "local": "1000",
+                    "remote": "0",
+                }
+            ],
+        )
+        self.assertEqual(self.engine.tradable("USD"), Decimal("5000"))
+
+    def test_reconcile_keeps_local_when_updates_overlap(self):
+        remote = self.client.get_account_balance.return_value
+
+        def fetch(_):
+            self.engine.on_order(_order("opened"))
+            return remote
+
+        self.client.get_account_balance.side_effect = fetch
+
+        self.assertEqual(len(self.engine.reconcile()), 1)
+        self.assertEqual(self.engine.tradable("USD"), Decimal("4000"))
+
+    def test_reconcile_does_not_replay_included_fill(self):
+        self.engine.on_order(_order("opened", side="sell"))
+
+        def fetch(_):
+            fill = {"traddeId": "t1", "fillQuantity": "1", "fillPrice": "20000"}
+            self.engine.on_order(_order("completed", side="sell", **fill))
+            return [_balance("BTC", "1"), _balance("USD", "25000")]
+
+        self.client.get_account_balance.side_effect = fetch
+
+        self.assertEqual(self.engine.reconcile(), [])
+        self.assertEqual(self.engine.get_balance("BTC")["heldBalance"], "0")
+        self.assertEqual(self.engine.tradable("BTC"), Decimal("1"))
+        self.assertEqual(self.engine.tradable("USD"), Decimal("25000"))
+
+    def test_no_clamp_and_report_only(self):
+        self.engine.adopt = False
+        self.engine.on_order(_order("opened", side="sell", quantity="3"))
+
+        self.assertEqual(self.engine.tradable("BTC"), Decimal("-1"))
+        self.assertEqual(len(self.engine.reconcile()), 1)
+        self.assertEqual(self.engine.tradable("BTC"), Decimal("-1"))
@@ -0,0 +1,117 @@
+from threading import Event
+from unittest import TestCase
+
+from pybitgo.ws.dispatch import CallbackDispatcher
+
+
+class TestWSDispatch(TestCase):
+    def test_per_key_ordering(self):
+        dispatcher = CallbackDispatcher(workers=4, overflow="block")
+        received = {"BTC-USD": [], "ETH-USD": []}
+
+        for i in range(500):
+            for product in received:
+                dispatcher.submit(product, received[product].append, i)
+
+        dispatcher.close()
+
+        for product in received:
+            self.assertEqual(received[product], list(range(500)))
+
+    def test_drop_oldest(self):
+        dispatcher = CallbackDispatcher(workers=1, queue_size=2)
+        release = Event()
+        received = []
+
+        dispatcher.submit("BTC-USD", lambda _: release.wait(), None)
+        while dispatcher.stats()["depth"]:
+            pass
+
+        for i in range(5):
+            dispatcher.submit("BTC-USD", received.append, i)
+
+        release.set()
+        dispatcher.close()
+
+        self.assertEqual(received, [3, 4])
+        self.assertEqual(dispatcher.stats()["dropped"], 3)
+
+    def test_undroppable_is_kept(self):
+        dispatcher = CallbackDispatcher(workers=1, queue_size=1, overflow="drop_newest")
+        received = []
+
+        for i in range(50):
+            dispatcher.submit("BTC-USD", received.append, i, droppable=False)
+
+        dispatcher.close()
+
+        self.assertEqual(received, list(range(50)))
+        self.assertEqual(dispatcher.stats()["dropped"], 0)
+
+    def test_drop_oldest_keeps_undroppable(self):
+        for queue_size, expected in [(2, ["order", "snap3"]), (1, ["order"])]:
+            dispatcher = CallbackDispatcher(workers=1, queue_size=queue_size)
+            release = Event()
+            received = []
+
+            dispatcher.submit("BTC-USD", lambda _: release.wait(), None)
+            while dispatcher.stats()["depth"]:
+                pass
+
+            dispatcher.submit("BTC-USD", received.append, "order", droppable=False)
+            for snap in ["snap1", "snap2", "snap3"]:
+                dispatcher.submit("BTC-USD", received.append, snap)
+
+            release.set()
+            dispatcher.close()
+
+            self.assertEqual(received, expected)
+            self.assertEqual(dispatcher.stats()["dropped"], 2 + (queue_size == 1))
+
+    def test_errors_do_not_stop_lane(self):
+        dispatcher = CallbackDispatcher(workers=1)
+        dispatcher.on_error = lambda _: None
+        received = []
+
+        dispatcher.submit("BTC-USD", lambda _: 1 / 0, None)
+        dispatcher.submit("BTC-USD", received.append, 1)
+        dispatcher.close()
+
+        self.assertEqual(received, [1])
+        self.assertEqual(dispatcher.stats()["errors"], 1)
+
+    def test_drop_oldest_conflates_per_key(self):
+        dispatcher = CallbackDispatcher(workers=1, queue_size=2)
+        release = Event()
+        received = []
+
+        dispatcher.submit("BTC-USD", lambda _: release.wait(), None)
+        while dispatcher.stats()["depth"]:
+            pass
+
+        dispatcher.submit("ETH-USD", received.append, "eth1")
+        dispatcher.submit("BTC-USD", received.append, "btc1")
+        dispatcher.submit("BTC-USD", received.append, "btc2")
+
+        release.set()
+        dispatcher.close()
+
+        self.assertEqual(received, ["eth1", "btc2"])
+
+    def test_undroppable_does_not_block(self):
+        dispatcher = CallbackDispatcher(workers=1, queue_size=1)
+        release = Event()
+        received = []
+
+        dispatcher.submit("BTC-USD", lambda _: release.wait(), None)
+        while dispatcher.stats()["depth"]:
+            pass
+
+        for i in range(5):
+            dispatcher.submit("BTC-USD", received.append, i, droppable=False)
+
+        self.assertEqual(dispatcher.stats()["max_depth"], 5)
+        release.set()
+        dispatcher.close()
+
+        self.assertEqual(received, list(range(5)))
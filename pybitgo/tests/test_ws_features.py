@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+import numpy as np
+
+from pybitgo.ws.features import BookFeatureStore, BookSeries
+
+
+def _snapshot(second: int, bid: float, ask: float):
+    return {
+        "channel": "level2",
+        "type": "snapshot",
+        "product": "BTC-USD",
+        "time": f"1970-01-01T00:00:{second:02d}Z",
+        "bids": [[str(bid), "3"], [str(bid - 1), "1"]],
+        "asks": [[str(ask), "1"]],
+    }
+
+
+class TestWSFeatures(TestCase):
+    def test_features(self):
+        store = BookFeatureStore(capacity=8, depth=2)
+        store.update(_snapshot(1, 99, 101))
+        row = store["BTC-USD"].window()[:, -1]
+
+        self.assertEqual(row.tolist(), [1, 100, 2, 0.6, 4, 1, (99 * 3 + 98 + 101) / 5])
+
+    def test_window_is_view_in_order(self):
+        series = BookSeries(capacity=4)
+
+        for i in range(10):
+            series.append(np.full(7, i))
+
+        window = series.column("time")
+        self.assertEqual(window.tolist(), [6, 7, 8, 9])
+        self.assertEqual(series.column("time", 2).tolist(), [8, 9])
+        self.assertTrue(np.shares_memory(window, series.data))
+
+    def test_statistics(self):
+        store = BookFeatureStore(capacity=16)
+
+        for i in range(16):
+            store.update(_snapshot(i, 99 + i % 2, 101 + i % 2))
+
+        series = store["BTC-USD"]
+        self.assertAlmostEqual(series.ewma("mid", alpha=1.0), 100 + 15 % 2)
+        self.assertAlmostEqual(series.ewma("spread"), 2)
+        self.assertGreater(series.volatility(), 0)
+        self.assertTrue(99 < series.vwap() < 102)
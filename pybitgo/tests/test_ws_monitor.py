@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+import time
+from unittest import TestCase
+
+from pybitgo.util import parse_time
+from pybitgo.ws.monitor import FeedMonitor, StaleFeedError
+
+
+def _snapshot(product: str, age: float = 0.0):
+    when = datetime.now(timezone.utc) - timedelta(seconds=age)
+
+    return {
+        "channel": "level2",
+        "type": "snapshot",
+        "product": product,
+        "time": when.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+        "bids": [],
+        "asks": [],
+    }
+
+
+class _Monitor(FeedMonitor):
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    def on_stale(self, product, reason):
+        self.events.append((product, reason))
+
+    def on_fresh(self, product):
+        self.events.append((product, None))
+
+
+class TestWSMonitor(TestCase):
+    def test_parse_time(self):
+        self.assertEqual(parse_time("1970-01-01T00:00:01.5Z"), 1.5)
+        self.assertEqual(parse_time("1970-01-01T01:00:00+01:00"), 0.0)
+        self.assertEqual(parse_time("2022-07-14T18:35:41.123456"), 1657823741.123456)
+
+    def test_latency_stale_and_fresh(self):
+        monitor = _Monitor(max_latency=1.0, halt_on_stale=True)
+
+        monitor.record(_snapshot("BTC-USD"))
+        monitor.guard("BTC-USD")
+
+        monitor.record(_snapshot("BTC-USD", age=5))
+        self.assertTrue(monitor.is_stale("BTC-USD"))
+        self.assertRaises(StaleFeedError, monitor.guard, "BTC-USD")
+
+        monitor.record(_snapshot("BTC-USD"))
+        self.assertFalse(monitor.is_stale("BTC-USD"))
+        self.assertEqual(monitor.events, [("BTC-USD", "latency"), ("BTC-USD", None)])
+
+    def test_silence(self):
+        monitor = _Monitor(max_interval=0.01)
+
+        monitor.record(_snapshot("BTC-USD"))
+        time.sleep(0.02)
+
+        self.assertEqual(monitor.check(), ["BTC-USD"])
+        self.assertEqual(monitor.check(), ["BTC-USD"])
+        self.assertEqual(monitor.events, [("BTC-USD", "silence")])
+
+        monitor.record(_snapshot("BTC-USD"))
+        self.assertEqual(monitor.stats("BTC-USD")["gaps"], 1)
+        self.assertEqual(monitor.check(), [])
+
+    def test_silence_without_watchdog(self):
+        monitor = _Monitor(max_interval=0.01, halt_on_stale=True)
+
+        monitor.record(_snapshot("BTC-USD"))
+        monitor.guard("BTC-USD")
+        time.sleep(0.02)
+
+        self.assertTrue(monitor.is_stale("BTC-USD"))
+        self.assertRaises(StaleFeedError, monitor.guard, "BTC-USD")
+        self.assertEqual(monitor.stats("BTC-USD")["stale"], True)
+        self.assertEqual(monitor.stats("BTC-USD")["reason"], "silence")
+
+    def test_percentiles(self):
+        monitor = FeedMonitor(window=10)
+
+        for age in range(20):
+            monitor.record(_snapshot("BTC-USD", age=age))
+
+        percentiles = monitor.latency_percentiles("BTC-USD", (0, 100))
+        self.assertAlmostEqual(percentiles[0], 10, delta=0.5)
+        self.assertAlmostEqual(percentiles[100], 19, delta=0.5)
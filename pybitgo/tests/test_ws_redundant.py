@@ -0,0 +1,104 @@
+import json
+from threading import Event
+import time
+from unittest import TestCase
+
+from pybitgo.ws.redundant import RedundantBitGoWSClient
+
+
+class _Client(RedundantBitGoWSClient):
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
+        self.snapshots = []
+        self.orders = []
+
+    def on_level2_snapshot(self, msg):
+        self.snapshots.append(msg["time"])
+
+    def on_order(self, msg):
+        self.orders.append((msg["orderId"], msg["status"]))
+
+
+def _snapshot(time: str) -> str:
+    return json.dumps(
+        {
+            "channel": "level2",
+            "type": "snapshot",
+            "product": "BTC-USD",
+            "time": time,
+            "bids": [],
+            "asks": [],
+        }
+    )
+
+
+def _order(status: str) -> str:
+    return json.dumps(
+        {
+            "channel": "order",
+            "type": "update",
+            "time": "2022-07-14T18:35:41.000Z",
+            "orderId": "1",
+            "product": "BTC-USD",
+            "status": status,
+        }
+    )
+
+
+class TestWSRedundant(TestCase):
+    def test_first_copy_wins(self):
+        client = _Client("token", connections=2)
+        first, second = client.legs
+
+        first.on_message(None, _snapshot("2022-07-14T18:35:41.000Z"))
+        second.on_message(None, _snapshot("2022-07-14T18:35:41.000Z"))
+        second.on_message(None, _snapshot("2022-07-14T18:35:42.000Z"))
+        first.on_message(None, _snapshot("2022-07-14T18:35:42.000Z"))
+        first.on_message(None, _snapshot("2022-07-14T18:35:40.000Z"))
+        client.dispatcher.join()
+
+        self.assertEqual(
+            client.snapshots, ["2022-07-14T18:35:41.000Z", "2022-07-14T18:35:42.000Z"]
+        )
+
+        stats = client.stats()
+        self.assertEqual((stats[0]["wins"], stats[0]["duplicates"]), (1, 2))
+        self.assertEqual((stats[1]["wins"], stats[1]["duplicates"]), (1, 1))
+
+    def test_orders_deduplicated_by_status(self):
+        client = _Client("token", connections=3)
+
+        for status in ["opened", "completed"]:
+            for leg in client.legs:
+                leg.on_message(None, _order(status))
+
+        client.dispatcher.join()
+
+        self.assertEqual(client.orders, [("1", "opened"), ("1", "completed")])
+
+    def test_latency_ignores_order_wins(self):
+        client = _Client("token", connections=1)
+        leg = client.legs[0]
+
+        leg.on_message(None, _snapshot("2022-07-14T18:35:41.000Z"))
+        latency = client.stats()[0]["mean_latency"]
+        leg.on_message(None, _order("opened"))
+
+        self.assertEqual(client.stats()[0]["wins"], 2)
+        self.assertEqual(client.stats()[0]["mean_latency"], latency)
+
+    def test_slow_callback_does_not_stall_other_legs(self):
+        client = _Client("token", connections=2)
+        release = Event()
+        client.on_level2_snapshot = lambda _: release.wait(5)
+        start = time.perf_counter()
+
+        client.legs[0].on_message(None, _snapshot("2022-07-14T18:35:41.000Z"))
+        client.legs[1].on_message(None, _snapshot("2022-07-14T18:35:42.000Z"))
+
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(client.stats()[1]["wins"], 1)
+
+        release.set()
+        client.dispatcher.close()
@@ -0,0 +1,67 @@
+import os
+from unittest import TestCase
+
+from pybitgo.ws.shm import _SEQ, SharedBookReader, SharedBookWriter
+
+
+def _snapshot(product: str, bids, asks):
+    return {
+        "channel": "level2",
+        "type": "snapshot",
+        "product": product,
+        "time": "1970-01-01T00:00:01.5Z",
+        "bids": bids,
+        "asks": asks,
+    }
+
+
+class TestWSShm(TestCase):
+    def setUp(self):
+        self.prefix = f"pybitgo_test_{os.getpid()}"
+        self.writer = SharedBookWriter(["TBTC-TUSD*"], depth=2, prefix=self.prefix)
+        self.reader = SharedBookReader(["TBTC-TUSD*"], prefix=self.prefix)
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close()
+
+    def test_read(self):
+        self.assertEqual(self.reader.read("TBTC-TUSD*").bids, [])
+
+        self.writer.publish(
+            _snapshot(
+                "TBTC-TUSD*",
+                [["100.5", "1"], ["100", "2"], ["99", "3"]],
+                [["101", "0.5"]],
+            )
+        )
+        snapshot = self.reader.read("TBTC-TUSD*")
+
+        self.assertEqual(snapshot.seq, 2)
+        self.assertEqual(snapshot.time, 1.5)
+        self.assertEqual(snapshot.bids, [(100.5, 1.0), (100.0, 2.0)])
+        self.assertEqual(snapshot.asks, [(101.0, 0.5)])
+
+    def test_view(self):
+        self.writer.publish(_snapshot("TBTC-TUSD*", [["100", "1"]], [["101", "2"]]))
+        seq, bids, asks = self.reader.view("TBTC-TUSD*")
+
+        self.assertEqual((bids.tolist(), asks.tolist()), ([100.0, 1.0], [101.0, 2.0]))
+        self.assertTrue(self.reader.validate("TBTC-TUSD*", seq))
+
+        self.writer.publish(_snapshot("TBTC-TUSD*", [["99", "1"]], [["102", "2"]]))
+        self.assertFalse(self.reader.validate("TBTC-TUSD*", seq))
+
+        bids.release()
+        asks.release()
+
+    def test_other_products_ignored(self):
+        self.writer.publish(_snapshot("ETH-USD", [["1", "1"]], []))
+        self.assertEqual(self.reader.seq("TBTC-TUSD*"), 0)
+
+    def test_dead_writer_times_out(self):
+        self.reader.timeout = 0.01
+        _SEQ.pack_into(self.writer.segments["TBTC-TUSD*"].buf, 0, 1)
+
+        self.assertRaises(Exception, self.reader.read, "TBTC-TUSD*")
+        self.assertRaises(Exception, self.reader.view, "TBTC-TUSD*")